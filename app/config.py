@@ -44,6 +44,7 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_REQUESTS: int = 10
     REQUEST_TIMEOUT: int = 30
     MAX_RETRIES: int = 3
+    SAVE_DEBUG_FILES: bool = False  # Archive fetched HTML and markdown from fetch_batch for inspection
 
     OPENROUTER_API_KEY: str = Field(..., env="OPENROUTER_API_KEY")
 
@@ -0,0 +1,148 @@
+"""Response cache for LLM chat completions"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+from loguru import logger
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletionMessageParam
+
+from app.config import get_settings
+
+
+class CacheBackend(Protocol):
+    """Storage used by LLMCache"""
+
+    async def get(self, key: str) -> str | None: ...
+
+    async def set(self, key: str, value: str, ttl: float) -> None: ...
+
+
+class MemoryBackend:
+    """In-process LRU cache with per-entry expiry"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        """Get a value if present and not expired"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        self.entries[key] = (value, time.monotonic() + ttl)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class LLMCache:
+    """Cache of LLM responses keyed on a SHA-256 of the request payload"""
+
+    def __init__(self, backend: CacheBackend | None = None):
+        self.backend: CacheBackend = backend or MemoryBackend()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(model: str, messages: list[ChatCompletionMessageParam], params: dict[str, Any] | None = None) -> str:
+        """
+        Build a cache key for a request
+
+        Args:
+            model: Model name
+            messages: Chat messages
+            params: Other request parameters, such as tools, max_tokens or response_format
+
+        Returns:
+            Hex SHA-256 digest of the request payload
+        """
+        # default=str covers non-JSON parameters such as a pydantic response_format class
+        payload = json.dumps({"model": model, "messages": messages, "params": params or {}}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> str | None:
+        """Get cached response for key"""
+        if not get_settings().ENABLE_CACHE:
+            return None
+
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        logger.debug(f"LLM cache hit ({self.stats['hits']} hits, {self.stats['misses']} misses)")
+        return value
+
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Cache response for key"""
+        settings = get_settings()
+        if not settings.ENABLE_CACHE:
+            return
+
+        await self.backend.set(key, value, ttl if ttl is not None else settings.CACHE_TTL)
+
+
+async def cached_completion(
+    client: AsyncOpenAI,
+    model: str,
+    messages: list[ChatCompletionMessageParam],
+    cache: LLMCache | None = None,
+    use_cache: bool = False,
+    **kwargs: Any,
+) -> str:
+    """
+    Run a chat completion, returning a cached response for identical requests
+
+    Caching is opt-in per call site, since a cached response replaces a fresh sample for the whole TTL.
+    Requests with a temperature above 0 are never cached. The key covers the model, messages and every other parameter.
+
+    Args:
+        client: OpenAI-compatible client
+        model: Provider-side model name
+        messages: Chat messages
+        cache: Cache to use (defaults to the shared llm_cache)
+        use_cache: Whether identical requests may reuse a cached response
+        **kwargs: Extra arguments passed to chat.completions.create
+
+    Returns:
+        Content of the first choice
+
+    Raises:
+        ValueError: If the model returns an empty response
+    """
+    cache = cache or llm_cache
+    use_cache = use_cache and not kwargs.get("temperature")
+    key = LLMCache.make_key(model, messages, kwargs) if use_cache else None
+
+    if key:
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+    response = await client.chat.completions.create(model=model, messages=messages, **kwargs)
+    if not response.choices or not response.choices[0].message.content:
+        raise ValueError("Empty response received from the model")
+
+    content = response.choices[0].message.content
+    if key:
+        await cache.set(key, content)
+    return content
+
+
+# Global cache instance
+llm_cache = LLMCache()
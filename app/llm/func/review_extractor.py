@@ -5,20 +5,87 @@ import asyncio
 import json
 import sys
 import traceback
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, TypeVar, Union
 
+import httpx
 import logfire
 from loguru import logger
+from openai import APIConnectionError, InternalServerError, RateLimitError
+from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from tqdm import tqdm
 
+from app.llm.cache import cached_completion
 from app.llm.constants import CLAUDE_SONNET_MODEL, O3_MINI_MODEL
 from app.llm.evals.review_evaluator import evaluate_extraction
-from app.llm.model_factory import create_model
+from app.llm.model_factory import create_client, create_model
 
+T = TypeVar("T")
 
+# Transient failures (rate limits, 5xx, dropped connections) worth retrying
+RETRYABLE_ERRORS = (httpx.HTTPError, asyncio.TimeoutError, APIConnectionError, RateLimitError, InternalServerError)
+
+# Maximum number of reviews merged in a single LLM call
+MERGE_GROUP_SIZE = 5
+
+# Seconds to wait on the first request before firing a backup (roughly P95 latency)
+HEDGE_DELAY = 15.0
+
+llm_retry = retry(
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+
+
+async def run_hedged(call: Callable[[], Awaitable[T]], hedge_delay: float | None = HEDGE_DELAY) -> T:
+    """
+    Run an LLM call, firing a backup request if the first one is slow.
+
+    If the first request hasn't returned after hedge_delay seconds, a second identical
+    request is started and whichever finishes first successfully wins; the other is cancelled.
+    Requests still running when the caller is cancelled or times out are cancelled too.
+
+    Args:
+        call: Factory returning a fresh awaitable for each attempt
+        hedge_delay: Seconds to wait before hedging, or None to disable hedging
+
+    Returns:
+        The result of the first successful request
+    """
+    pending = {asyncio.ensure_future(call())}
+    error: BaseException | None = None
+    try:
+        if hedge_delay is None:
+            return await next(iter(pending))
+
+        done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+        if done:
+            return done.pop().result()
+
+        logger.info(f"No response after {hedge_delay}s, sending hedged request")
+        pending.add(asyncio.ensure_future(call()))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+    finally:
+        for task in pending:
+            if not task.done():
+                task.cancel()
+
+    assert error is not None
+    raise error
+
+
+@llm_retry
 async def extract_reviews(article_text: str, model_name: str, product_name: Optional[str] = None, token_limit: Optional[int] = None) -> str:
     """
     Analyze a product review article and extract structured information.
@@ -37,11 +104,8 @@ async def extract_reviews(article_text: str, model_name: str, product_name: Opti
         if product_name:
             logger.info(f"Extracting reviews for product: {product_name}")
 
-        # Create appropriate model instance
-        model = create_model(model_name)
-
-        # Create agent with our result type
-        agent = Agent(model=model, result_type=str)
+        # A plain-text result needs no agent framework, so call the chat completions API directly
+        client, provider_model_name = create_client(model_name)
 
         # Base prompt
         prompt = """**Role**: Meticulous analyst summarizing product reviews. Goal: Accurate, balanced, factual summary.
@@ -68,24 +132,54 @@ async def extract_reviews(article_text: str, model_name: str, product_name: Opti
         if token_limit:
             prompt += f"\nToken Limit: Keep your response under {token_limit} tokens. Be more concise and prioritize important information while maintaining accuracy."
 
-        prompt += "\nCurrent Input:\n" + article_text
-
-        result = await agent.run(prompt)
-        return result.data
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": prompt},
+            {"role": "user", "content": "Current Input:\n" + article_text},
+        ]
+        return await run_hedged(lambda: cached_completion(client, provider_model_name, messages))
 
     except Exception as e:
         logger.error(f"Failed to analyze review article: {str(e)}")
         raise
 
 
+@llm_retry
+async def _merge_once(agent: Agent[None, str], prompt: str, review_texts: list[str]) -> str:
+    """
+    Merge a single group of review texts with one LLM call.
+
+    Args:
+        agent: Agent used to run the merge
+        prompt: Merge instructions without the reviews
+        review_texts: Review texts to merge in this call
+
+    Returns:
+        The merged summary for this group
+    """
+    # Combine all review texts with separators
+    combined_reviews = "\n\n===== REVIEW SEPARATOR =====\n\n".join(review_texts)
+    full_prompt = prompt + "\n\nREVIEWS TO SYNTHESIZE:\n" + combined_reviews
+
+    result = await run_hedged(lambda: agent.run(full_prompt))
+    return result.data
+
+
 async def merge_reviews(
-    review_texts: List[str], model_name: str, product_name: str, token_limit: Optional[int] = None, output_format: str = "structured"
+    review_texts: List[str],
+    model_name: str,
+    product_name: str,
+    token_limit: Optional[int] = None,
+    output_format: str = "structured",
+    group_size: int = MERGE_GROUP_SIZE,
 ) -> str:
     """
     Merge multiple review texts into a comprehensive product summary highlighting key features, pros, and cons.
 
     This function takes multiple review summaries (which could be from different sources or reviewers)
     and synthesizes them into a single, coherent product summary that helps users make purchase decisions.
+    When there are more than group_size reviews, they are merged hierarchically: groups of group_size
+    are merged in parallel and the partial summaries are merged again until one summary remains, so
+    each call stays within the model's context window.
 
     Args:
         review_texts: List of review text summaries to merge
@@ -93,10 +187,14 @@ async def merge_reviews(
         product_name: Name of the product being reviewed
         token_limit: Optional maximum token limit for the summary
         output_format: Format of the output summary - "structured" (with clear sections) or "narrative" (flowing text)
+        group_size: Maximum number of reviews merged in a single LLM call
 
     Returns:
         A comprehensive product summary with key features, pros, and cons
     """
+    if group_size < 2:
+        raise ValueError("group_size must be at least 2")
+
     try:
         logger.info(f"Merging {len(review_texts)} reviews for {product_name} using model: {model_name}")
 
@@ -106,9 +204,6 @@ async def merge_reviews(
         # Create agent with our result type
         agent = Agent(model=model, result_type=str)
 
-        # Combine all review texts with separators
-        combined_reviews = "\n\n===== REVIEW SEPARATOR =====\n\n".join(review_texts)
-
         # Base prompt for merging reviews
         prompt = f"""**Role**: Expert product analyst synthesizing multiple reviews for {product_name}.
         
@@ -174,10 +269,16 @@ Format your response as a flowing narrative that's easy to read while still clea
         if token_limit:
             prompt += f"\nToken Limit: Keep your response under {token_limit} tokens. Be concise while maintaining all critical information."
 
-        prompt += "\n\nREVIEWS TO SYNTHESIZE:\n" + combined_reviews
+        async def reduce(texts: list[str]) -> str:
+            if len(texts) <= group_size:
+                return await _merge_once(agent, prompt, texts)
+
+            groups = [texts[i : i + group_size] for i in range(0, len(texts), group_size)]
+            logger.info(f"Merging {len(texts)} reviews in {len(groups)} groups of up to {group_size}")
+            partials = await asyncio.gather(*(_merge_once(agent, prompt, group) for group in groups))
+            return await reduce(list(partials))
 
-        result = await agent.run(prompt)
-        return result.data
+        return await reduce(review_texts)
 
     except Exception as e:
         logger.error(f"Failed to merge reviews: {str(e)}")
@@ -2,11 +2,11 @@ import asyncio
 import sys
 
 from loguru import logger
-from openai import AsyncOpenAI
 from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
+from app.llm.cache import cached_completion
 from app.llm.constants import GPT_4_MINI_MODEL
-from app.config import get_settings
+from app.llm.model_factory import create_client
 from app.utils.count_token import count_tokens
 
 
@@ -24,16 +24,13 @@ async def generate_summary(content: str) -> str:
     initial_token_count = count_tokens(content)
     logger.info(f"Input content contains {initial_token_count} tokens")
 
-    settings = get_settings()
-    client = AsyncOpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=settings.OPENROUTER_API_KEY,
-    )
+    client, model_name = create_client(GPT_4_MINI_MODEL)
 
     try:
-        response = await client.chat.completions.create(
-            model=GPT_4_MINI_MODEL,
-            messages=[
+        summary = await cached_completion(
+            client,
+            model_name,
+            [
                 {
                     "role": "user",
                     "content": f"Please summarize this content: {content}",
@@ -41,13 +38,6 @@ async def generate_summary(content: str) -> str:
             ],
         )
 
-        if not response.choices or not response.choices[0].message.content:
-            raise ValueError("Empty response received from the model")
-
-        summary: str = response.choices[0].message.content
-        if not isinstance(summary, str):
-            raise ValueError("Invalid response type from model")
-
         summary_token_count = count_tokens(summary)
         logger.info(f"Generated summary contains {summary_token_count} tokens (reduced by {initial_token_count - summary_token_count} tokens)")
 
@@ -61,6 +51,10 @@ async def generate_summary(content: str) -> str:
 
 
 if __name__ == "__main__":
+    import tarfile
+
+    from app.scraper.crawler.html_fetcher import DEBUG_ARCHIVE
+
     # Configure logging
     logger.remove()
     logger.add(
@@ -74,18 +68,18 @@ if __name__ == "__main__":
         level="INFO",
     )
 
-    # Load content from debug file
-    debug_file = "debug/9to5mac_com_2024_10_19_iphone_16_pro_review_one_month_later_.md"
+    # Load content saved by the crawler's debug archive
+    debug_file = "9to5mac_com_2024_10_19_iphone_16_pro_review_one_month_later_.md"
     try:
-        with open(debug_file, encoding="utf-8") as f:
-            content = f.read()
+        with tarfile.open(DEBUG_ARCHIVE) as archive:
+            content = archive.extractfile(debug_file).read().decode("utf-8")  # type: ignore[union-attr]
             logger.info(f"Loaded content from {debug_file}")
 
         # Generate summary
         summary = asyncio.run(generate_summary(content))
         print(summary)
 
-    except FileNotFoundError:
+    except (FileNotFoundError, KeyError):
         logger.error(f"Debug file not found: {debug_file}")
     except Exception as e:
         logger.error(f"Error processing file: {str(e)}")
@@ -1,13 +1,144 @@
 """Factory for creating appropriate model instances."""
 
+import asyncio
+import weakref
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Union
 
+import httpx
 from loguru import logger
+from openai import DEFAULT_TIMEOUT, AsyncOpenAI
 from pydantic_ai.models.gemini import GeminiModel
 from pydantic_ai.models.openai import OpenAIModel
 
 from app.config import get_settings
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+GEMINI_OPENAI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"
+
+# (model name prefix, provider, whether to strip the "vendor/" prefix before sending)
+PROVIDER_PREFIXES: tuple[tuple[str, str, bool], ...] = (
+    ("google/", "gemini", True),
+    ("gemini-", "gemini", False),
+)
+
+# provider -> (base URL, settings field holding the API key)
+PROVIDER_ENDPOINTS: dict[str, tuple[str, str]] = {
+    "gemini": (GEMINI_OPENAI_BASE_URL, "GEMINI_API_KEY"),
+    "openrouter": (OPENROUTER_BASE_URL, "OPENROUTER_API_KEY"),
+}
+
+
+@dataclass(frozen=True)
+class ProviderConfig:
+    """Where and how to reach a model"""
+
+    provider: str
+    model_name: str
+    base_url: str
+    api_key_setting: str
+
+
+@lru_cache(maxsize=256)
+def determine_provider_config(model_name: str) -> ProviderConfig:
+    """
+    Resolve the provider endpoint for a model name.
+
+    Args:
+        model_name: Name of the model to use
+
+    Returns:
+        ProviderConfig with the provider-side model name, base URL and settings field holding the API key
+    """
+    # Default to OpenRouter for models without a known prefix
+    provider, strip_prefix = "openrouter", False
+    for prefix, prefix_provider, prefix_strip in PROVIDER_PREFIXES:
+        if model_name.startswith(prefix):
+            provider, strip_prefix = prefix_provider, prefix_strip
+            break
+
+    base_url, api_key_setting = PROVIDER_ENDPOINTS[provider]
+    provider_model_name = model_name.split("/", 1)[1] if strip_prefix else model_name
+    return ProviderConfig(provider, provider_model_name, base_url, api_key_setting)
+
+
+@cache
+def get_api_key(setting_name: str) -> str:
+    """
+    Look up an API key from settings once per process.
+
+    Args:
+        setting_name: Name of the settings field holding the key
+
+    Returns:
+        The API key
+    """
+    return str(getattr(get_settings(), setting_name))
+
+
+def refresh_api_key_cache() -> None:
+    """Forget cached settings and API keys, e.g. after changing the environment in tests."""
+    get_settings.cache_clear()
+    get_api_key.cache_clear()
+
+
+# Shared clients keyed by event loop, then (base_url, api_key), so repeated calls reuse pooled connections.
+# Pooled connections can't move between loops, and each loop's clients are dropped along with the loop
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], AsyncOpenAI]] = weakref.WeakKeyDictionary()
+
+
+def _new_client(base_url: str, api_key: str) -> AsyncOpenAI:
+    """Create an AsyncOpenAI client backed by a pooled HTTP/2 httpx.AsyncClient."""
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=DEFAULT_TIMEOUT,
+    )
+    return AsyncOpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
+
+
+def get_client(base_url: str, api_key: str) -> AsyncOpenAI:
+    """
+    Get a shared AsyncOpenAI client for the given endpoint and API key.
+
+    A client is only reused on the event loop it was created on, so entry points
+    calling asyncio.run more than once get a fresh client for each loop.
+
+    Args:
+        base_url: Base URL of the OpenAI-compatible API
+        api_key: API key for the endpoint
+
+    Returns:
+        Cached client backed by a pooled HTTP/2 httpx.AsyncClient
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Outside a loop the client binds to whichever loop first uses it, so it can't be shared
+        return _new_client(base_url, api_key)
+
+    clients = _clients.setdefault(loop, {})
+    key = (base_url, api_key)
+    if key not in clients:
+        clients[key] = _new_client(base_url, api_key)
+    return clients[key]
+
+
+async def close_clients() -> None:
+    """Close all shared clients and their connection pools."""
+    current_loop = asyncio.get_running_loop()
+    loop_clients = list(_clients.items())
+    _clients.clear()
+    for loop, clients in loop_clients:
+        for client in clients.values():
+            if loop is current_loop:
+                await client.close()
+            elif loop.is_running():
+                # Close on the loop that owns the connections
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.close(), loop))
+            # Clients of a stopped loop can't be closed from here and are released with it
+
 
 def create_model(model_name: str) -> Union[OpenAIModel, GeminiModel]:
     """
@@ -19,21 +150,29 @@ def create_model(model_name: str) -> Union[OpenAIModel, GeminiModel]:
     Returns:
         Model instance appropriate for the given model name
     """
-    settings = get_settings()
+    config = determine_provider_config(model_name)
+    api_key = get_api_key(config.api_key_setting)
 
-    if model_name.startswith("google/") or model_name.startswith("gemini-"):
-        # Strip prefix if present
-        gemini_name = model_name.replace("google/", "")
-        logger.info(f"Creating Gemini model instance for {gemini_name}")
-        return GeminiModel(
-            model_name=gemini_name,
-            api_key=settings.GEMINI_API_KEY,
-        )
+    if config.provider == "gemini":
+        logger.info(f"Creating Gemini model instance for {config.model_name}")
+        return GeminiModel(model_name=config.model_name, api_key=api_key)
     else:
-        # Default to OpenAI/OpenRouter for other models
         logger.info(f"Creating OpenAI model instance for {model_name}")
-        return OpenAIModel(
-            model_name=model_name,
-            base_url="https://openrouter.ai/api/v1",
-            api_key=settings.OPENROUTER_API_KEY,
-        )
+        return OpenAIModel(model_name=config.model_name, openai_client=get_client(config.base_url, api_key))
+
+
+def create_client(model_name: str) -> tuple[AsyncOpenAI, str]:
+    """
+    Create an OpenAI-compatible client for plain chat completions.
+
+    Gemini models go through Google's OpenAI-compatible endpoint, everything else through OpenRouter.
+
+    Args:
+        model_name: Name of the model to use
+
+    Returns:
+        Tuple of (client, model name to send to the provider)
+    """
+    config = determine_provider_config(model_name)
+    api_key = get_api_key(config.api_key_setting)
+    return get_client(config.base_url, api_key), config.model_name
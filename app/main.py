@@ -3,29 +3,20 @@ Main application module for the Shop Backend API
 """
 
 import logfire
-import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
+from app.scraper.bright_data.client import close_client as close_bright_data_client
+from app.scraper.cache import scrape_cache
+from app.scraper.crawler.html_fetcher import close_client as close_crawler_client
+from app.scraper.crawler.html_fetcher import close_markdown_pool
+from app.scraper.oxylabs.client import close_client as close_oxylabs_client
 from app.scraper.router import router as scraper_router
+from app.scraper.searchapi.client import close_client as close_searchapi_client
 
 settings = get_settings()
 
-if settings.ENVIRONMENT == "prod":
-    sentry_sdk.init(
-        dsn="https://595562752640a86693f4bb4dfa9ecf98@o4508708809277440.ingest.us.sentry.io/4508708810915840",
-        # Set traces_sample_rate to 1.0 to capture 100%
-        # of transactions for tracing.
-        traces_sample_rate=1.0,
-        _experiments={
-            # Set continuous_profiling_auto_start to True
-            # to automatically start the profiler on when
-            # possible.
-            "continuous_profiling_auto_start": True,
-        },
-    )
-
 
 # Create FastAPI app
 app = FastAPI(
@@ -46,11 +37,48 @@ app.add_middleware(
 # Include routers
 app.include_router(scraper_router, prefix=settings.API_V0_STR, tags=["scraper"])
 
+
+@app.on_event("startup")
+async def startup() -> None:
+    """Set up error tracking and system metrics once the server starts, keeping them off the import path"""
+    if settings.ENVIRONMENT == "prod":
+        import sentry_sdk
+
+        sentry_sdk.init(
+            dsn="https://595562752640a86693f4bb4dfa9ecf98@o4508708809277440.ingest.us.sentry.io/4508708810915840",
+            # Set traces_sample_rate to 1.0 to capture 100%
+            # of transactions for tracing.
+            traces_sample_rate=1.0,
+            _experiments={
+                # Set continuous_profiling_auto_start to True
+                # to automatically start the profiler on when
+                # possible.
+                "continuous_profiling_auto_start": True,
+            },
+        )
+
+    logfire.instrument_system_metrics()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """Flush the scrape cache and close shared HTTP clients and worker pools"""
+    # Only pay for the LLM client imports at shutdown if nothing loaded them yet
+    from app.llm.model_factory import close_clients
+
+    await close_clients()
+    await close_bright_data_client()
+    await close_crawler_client()
+    await close_oxylabs_client()
+    await close_searchapi_client()
+    close_markdown_pool()
+    await scrape_cache.flush()
+
+
 logfire.configure(send_to_logfire="if-token-present", environment=settings.ENVIRONMENT)
 logfire.instrument_pydantic()
 logfire.instrument_httpx()
 logfire.instrument_fastapi(app)
-logfire.instrument_system_metrics()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Identifiers(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     gtin: str | None = Field(default=None, description="Global Trade Item Number.")
     mpn: str | None = Field(default=None, description="Manufacturer Part Number")
     asin: str | None = Field(default=None, description="Amazon Standard Identification Number.")
@@ -14,6 +16,8 @@ class Identifiers(BaseModel):
 
 
 class Ratings(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     one_star: int | None = Field(default=None, description="Number of 1-star ratings")
     two_stars: int | None = Field(default=None, description="Number of 2-star ratings")
     three_stars: int | None = Field(default=None, description="Number of 3-star ratings")
@@ -28,17 +32,17 @@ class Product(BaseModel):
     title: str | None = Field(default=None, description="The title or name of the product.")
     description: str | None = Field(default=None, description="A description of the product.")
     images: list[str] | None = Field(default=None, description="Array of URLs for product images.")
-    feature_image: str | None = Field(default=None, format="url", description="URL of the product image")
-    videos: list[str] | None = Field(default=None, format="url", description="URL of the product videos")
+    feature_image: str | None = Field(default=None, json_schema_extra={"format": "url"}, description="URL of the product image")
+    videos: list[str] | None = Field(default=None, json_schema_extra={"format": "url"}, description="URL of the product videos")
     video_count: int | None = Field(default=None, description="Number of product videos")
     identifiers: Identifiers | None = Field(default=None, description="Object of identifiers")
     brand: str | None = Field(default=None, description="The brand of the product")
-    url: str | None = Field(default=None, format="url", description="URL of the product")
+    url: str | None = Field(default=None, json_schema_extra={"format": "url"}, description="URL of the product")
     features: list[str] | None = Field(default=None, description="Features of the product")
     date_first_available: str | None = Field(default=None, description="Date of first availability of the product")
 
     seller_name: str | None = Field(default=None, description="Name of the seller")
-    seller_url: str | None = Field(default=None, format="url", description="URL of the seller")
+    seller_url: str | None = Field(default=None, json_schema_extra={"format": "url"}, description="URL of the seller")
 
     # Product Specifications
     size: str | None = Field(default=None, description="Size of the product")
@@ -84,12 +88,12 @@ class Product(BaseModel):
     amazon_number_of_sellers: int | None = Field(default=None, description="Number of sellers on Amazon")
     amazon_root_bs_rank: int | None = Field(default=None, description="Best sellers rank on Amazon")
     amazon_answered_questions: int | None = Field(default=None, description="Number of questions answered on Amazon")
-    # amazon_domain: Optional[str] = Field(default=None, format="url", description="URL of product domain on Amazon")
+    # amazon_domain: Optional[str] = Field(default=None, json_schema_extra={"format": "url"}, description="URL of product domain on Amazon")
     amazon_plus_content: bool | None = Field(default=None, description="Additional content indicator on Amazon")
     amazon_top_review: str | None = Field(default=None, description="Top review for product on Amazon")
     amazon_buybox_prices: dict[str, float] | None = Field(default=None, description="Amazon product price details")
     amazon_input_asin: str | None = Field(default=None, description="Input asin on Amazon")
-    amazon_origin_url: str | None = Field(default=None, format="url", description="Origin url of product on Amazon")
+    amazon_origin_url: str | None = Field(default=None, json_schema_extra={"format": "url"}, description="Origin url of product on Amazon")
     amazon_bought_past_month: int | None = Field(default=None, description="Product bought in last month on Amazon")
     amazon_is_available: bool | None = Field(default=None, description="Availability indicator of the product on Amazon")
     amazon_root_bs_category: str | None = Field(default=None, description="Best seller root category on Amazon")
@@ -105,13 +109,15 @@ class Product(BaseModel):
     amazon_customer_says: str | None = Field(default=None, description="Customer review on Amazon")
     amazon_sustainability_features: list[dict[str, Any]] | None = Field(default=None, description="Sustainability features of the product on Amazon")
     amazon_climate_pledge_friendly: bool | None = Field(default=None, description="Climate pledge indicator on Amazon")
-    amazon_videos: list[str] | None = Field(default=None, format="url", description="Videos of the product on Amazon")
+    amazon_videos: list[str] | None = Field(default=None, json_schema_extra={"format": "url"}, description="Videos of the product on Amazon")
     amazon_other_sellers_prices: list[dict[str, Any]] | None = Field(default=None, description="Other sellers prices on Amazon")
-    amazon_downloadable_videos: list[str] | None = Field(default=None, format="url", description="Downloadable videos on Amazon")
+    amazon_downloadable_videos: list[str] | None = Field(
+        default=None, json_schema_extra={"format": "url"}, description="Downloadable videos on Amazon"
+    )
 
     # Marketplace Specific - Walmart
     walmart_top_reviews: dict[str, Any] | None = Field(default=None, description="Top reviews of product on Walmart")
-    walmart_related_pages: list[str] | None = Field(default=None, format="url", description="Related pages on Walmart")
+    walmart_related_pages: list[str] | None = Field(default=None, json_schema_extra={"format": "url"}, description="Related pages on Walmart")
     walmart_available_for_delivery: bool | None = Field(default=None, description="Product is available for delivery on Walmart")
     walmart_available_for_pickup: bool | None = Field(default=None, description="Product is available for pickup on Walmart")
     walmart_breadcrumbs: list[dict[str, str]] | None = Field(default=None, description="Breadcrumbs of product on Walmart")
@@ -120,9 +126,11 @@ class Product(BaseModel):
     walmart_product_id: str | None = Field(default=None, description="Product ID on Walmart")
     walmart_product_name: str | None = Field(default=None, description="Product name on Walmart")
     walmart_review_tags: list[str] | None = Field(default=None, description="Tags of the review on Walmart")
-    walmart_category_url: str | None = Field(default=None, format="url", description="URL of category on Walmart")
+    walmart_category_url: str | None = Field(default=None, json_schema_extra={"format": "url"}, description="URL of category on Walmart")
     walmart_category_name: str | None = Field(default=None, description="Name of the category on Walmart")
-    walmart_root_category_url: str | None = Field(default=None, format="url", description="URL of the root category on Walmart")
+    walmart_root_category_url: str | None = Field(
+        default=None, json_schema_extra={"format": "url"}, description="URL of the root category on Walmart"
+    )
     walmart_root_category_name: str | None = Field(default=None, description="Name of the root category on Walmart")
     walmart_rating: float | None = Field(default=None, description="Rating of the product on Walmart")
     walmart_aisle: str | None = Field(default=None, description="Aisle on Walmart")
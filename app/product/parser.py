@@ -5,23 +5,96 @@ from typing import Any
 from dotenv import load_dotenv
 from loguru import logger
 from product.model import Identifiers, Product, Ratings
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.scraper.bright_data.amazon import Product as AmazonProduct
-from app.scraper.bright_data.amazon import scrape_amazon_product
 
 
 class ProductDetail(BaseModel):
     """Product detail model"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: str
     value: str
 
 
+# (Product field, AmazonProduct attribute) pairs copied as-is
+PRODUCT_FIELD_MAP: tuple[tuple[str, str], ...] = (
+    # Basic Product Information
+    ("title", "title"),
+    ("description", "description"),
+    ("brand", "brand"),
+    ("feature_image", "image_url"),
+    ("video_count", "video_count"),
+    ("url", "url"),
+    ("date_first_available", "date_first_available"),
+    # Seller Information
+    ("seller_name", "seller_name"),
+    ("seller_url", "seller_url"),
+    # Product Specifications
+    ("weight", "item_weight"),
+    ("model_number", "model_number"),
+    ("manufacturer", "manufacturer"),
+    ("country_of_origin", "country_of_origin"),
+    ("ingredients", "ingredients"),
+    # Category Information
+    ("original_categories", "categories"),
+    ("canonical_categories", "categories"),
+    # Price and Offers
+    ("final_price", "final_price"),
+    ("initial_price", "initial_price"),
+    ("discount", "discount"),
+    ("currency", "currency"),
+    ("availability", "availability"),
+    # Ratings and Reviews
+    ("reviews_count", "reviews_count"),
+    # Amazon Specific Fields
+    ("amazon_parent_asin", "parent_asin"),
+    ("amazon_number_of_sellers", "number_of_sellers"),
+    ("amazon_root_bs_rank", "root_bs_rank"),
+    ("amazon_answered_questions", "answered_questions"),
+    ("amazon_plus_content", "plus_content"),
+    ("amazon_top_review", "top_review"),
+    ("amazon_input_asin", "input_asin"),
+    ("amazon_origin_url", "origin_url"),
+    ("amazon_bought_past_month", "bought_past_month"),
+    ("amazon_is_available", "is_available"),
+    ("amazon_root_bs_category", "root_bs_category"),
+    ("amazon_bs_category", "bs_category"),
+    ("amazon_bs_rank", "bs_rank"),
+    ("amazon_badge", "badge"),
+    ("amazon_choice", "amazon_choice"),
+    ("amazon_customer_says", "customer_says"),
+    ("amazon_sustainability_features", "sustainability_features"),
+    ("amazon_climate_pledge_friendly", "climate_pledge_friendly"),
+    ("amazon_videos", "videos"),
+    ("amazon_other_sellers_prices", "other_sellers_prices"),
+)
+
+
+def index_product_details(product_details: list[dict[str, Any]] | None) -> dict[str, str]:
+    """
+    Index product details by type for repeated lookups
+
+    Args:
+        product_details: List of product detail dictionaries
+
+    Returns:
+        dict[str, str]: Mapping of detail type to its first value
+    """
+    index: dict[str, str] = {}
+    for detail in product_details or ():
+        index.setdefault(detail["type"], detail["value"])
+    return index
+
+
 def extract_product_attribute(product_details: list[dict[str, Any]], attribute_type: str) -> str | None:
     """
     Extract specific attribute from product details
 
+    Use index_product_details directly when looking up several attributes from the same list.
+
     Args:
         product_details: List of product detail dictionaries
         attribute_type: Type of attribute to extract
@@ -29,101 +102,56 @@ def extract_product_attribute(product_details: list[dict[str, Any]], attribute_t
     Returns:
         Optional[str]: Extracted attribute value or None
     """
-    if not product_details:
-        return None
-
-    matches = [detail["value"] for detail in product_details if detail["type"] == attribute_type]
-    return matches[0] if matches else None
+    return index_product_details(product_details).get(attribute_type)
 
 
-def parse_amazon_product(amazon_product: AmazonProduct) -> Product:
+def parse_amazon_product(amazon_product: AmazonProduct, validate: bool = False) -> Product:
     """
-    Parse AmazonProduct data into Product model"""
+    Parse AmazonProduct data into Product model
 
-    # Create identifiers
-    identifiers = Identifiers(
-        asin=amazon_product.asin,
-        upc=amazon_product.upc,
-    )
+    The input is already validated, so models are built with model_construct by default.
+
+    Args:
+        amazon_product: Scraped Amazon product
+        validate: Whether to run full Pydantic validation on the result
+
+    Returns:
+        Product: Parsed product
+    """
+    identifiers_fields = {"asin": amazon_product.asin, "upc": amazon_product.upc}
+    identifiers = Identifiers.model_validate(identifiers_fields) if validate else Identifiers.model_construct(**identifiers_fields)
 
     # Create ratings if available
     ratings = None
     if amazon_product.rating:
-        ratings = Ratings(
-            average_rating=amazon_product.rating,
-            total_ratings=amazon_product.reviews_count,
-        )
+        ratings_fields = {"average_rating": amazon_product.rating, "total_ratings": amazon_product.reviews_count}
+        ratings = Ratings.model_validate(ratings_fields) if validate else Ratings.model_construct(**ratings_fields)
 
-    # Convert variations to dictionaries
+    # Convert variations to plain dictionaries, dropping unset fields
     variants = None
     if amazon_product.variations:
-        variants = [variation.model_dump() for variation in amazon_product.variations]
+        variants = [variation.model_dump(mode="python", exclude_none=True) for variation in amazon_product.variations]
+
+    # Use the same timestamp for both fields when the scrape has none
+    timestamp = amazon_product.timestamp or datetime.now()
 
-    return Product(
-        # Basic Product Information
-        title=amazon_product.title,
-        description=amazon_product.description,
-        brand=amazon_product.brand,
+    fields: dict[str, Any] = {dst: getattr(amazon_product, src) for dst, src in PRODUCT_FIELD_MAP}
+    fields.update(
         images=amazon_product.images or [],
-        feature_image=amazon_product.image_url,
         videos=amazon_product.videos or [],
-        video_count=amazon_product.video_count,
-        identifiers=identifiers,
-        url=amazon_product.url,
         features=amazon_product.features or [],
-        date_first_available=amazon_product.date_first_available,
-        # Seller Information
-        seller_name=amazon_product.seller_name,
-        seller_url=amazon_product.seller_url,
-        # Product Specifications
-        weight=amazon_product.item_weight,
-        model_number=amazon_product.model_number,
-        manufacturer=amazon_product.manufacturer,
-        country_of_origin=amazon_product.country_of_origin,
-        ingredients=amazon_product.ingredients,
-        # Category Information
-        original_categories=amazon_product.categories,
-        canonical_categories=amazon_product.categories,
-        # Price and Offers
-        final_price=amazon_product.final_price,
-        initial_price=amazon_product.initial_price,
-        discount=amazon_product.discount,
-        currency=amazon_product.currency,
-        availability=amazon_product.availability,
-        variants=variants,
-        # Ratings and Reviews
+        identifiers=identifiers,
         ratings=ratings,
-        reviews_count=amazon_product.reviews_count,
-        # Amazon Specific Fields
-        amazon_parent_asin=amazon_product.parent_asin,
-        amazon_number_of_sellers=amazon_product.number_of_sellers,
-        amazon_root_bs_rank=amazon_product.root_bs_rank,
-        amazon_answered_questions=amazon_product.answered_questions,
-        amazon_plus_content=amazon_product.plus_content,
-        amazon_top_review=amazon_product.top_review,
-        amazon_input_asin=amazon_product.input_asin,
-        amazon_origin_url=amazon_product.origin_url,
-        amazon_bought_past_month=amazon_product.bought_past_month,
-        amazon_is_available=amazon_product.is_available,
-        amazon_root_bs_category=amazon_product.root_bs_category,
-        amazon_bs_category=amazon_product.bs_category,
-        amazon_bs_rank=amazon_product.bs_rank,
-        amazon_badge=amazon_product.badge,
+        variants=variants,
         amazon_subcategory_rank=(
             [{"subcategory_name": rank.subcategory_name, "subcategory_rank": rank.subcategory_rank} for rank in amazon_product.subcategory_rank]
             if amazon_product.subcategory_rank
             else None
         ),
-        amazon_choice=amazon_product.amazon_choice,
-        amazon_customer_says=amazon_product.customer_says,
-        amazon_sustainability_features=amazon_product.sustainability_features,
-        amazon_climate_pledge_friendly=amazon_product.climate_pledge_friendly,
-        amazon_videos=amazon_product.videos,
-        amazon_other_sellers_prices=amazon_product.other_sellers_prices,
-        # Timestamps
-        created_at=amazon_product.timestamp or datetime.now(),
-        updated_at=amazon_product.timestamp or datetime.now(),
+        created_at=timestamp,
+        updated_at=timestamp,
     )
+    return Product.model_validate(fields) if validate else Product.model_construct(**fields)
 
 
 async def main(urls: list[str]) -> None:
@@ -133,39 +161,34 @@ async def main(urls: list[str]) -> None:
     Args:
         urls: List of Amazon product URLs to process
     """
+    # Imported here because the service module depends on this parser
+    from product.service import get_products
+
     try:
-        # Scrape products
-        product_response = await scrape_amazon_product(urls)
+        # Scrape and parse all products in one batch
+        products = await get_products(urls)
 
-        if not product_response or not product_response.products:
+        if not any(products):
             logger.error("No products found")
             return
 
-        # Parse each product
-        for raw_product in product_response.products:
-            try:
-                # Create AmazonProduct instance
-
-                # Parse to our Product model
-                product = parse_amazon_product(raw_product)
-
-                # Print product details
-                logger.info(
-                    f"\nParsed Product Details:"
-                    f"\nTitle: {product.title}"
-                    f"\nBrand: {product.brand}"
-                    f"\nPrice: {product.final_price} {product.currency}"
-                    f"\nASIN: {product.identifiers.asin if product.identifiers else 'N/A'}"
-                    f"\nURL: {product.url}"
-                )
-
-                # Optional: Print full product details
-                logger.debug(f"Full product details:\n" f"{product.model_dump_json(indent=2)}")
-
-            except Exception as e:
-                logger.error(f"Error parsing product: {str(e)}", exc_info=True)
+        for product in products:
+            if product is None:
                 continue
 
+            # Print product details
+            logger.info(
+                f"\nParsed Product Details:"
+                f"\nTitle: {product.title}"
+                f"\nBrand: {product.brand}"
+                f"\nPrice: {product.final_price} {product.currency}"
+                f"\nASIN: {product.identifiers.asin if product.identifiers else 'N/A'}"
+                f"\nURL: {product.url}"
+            )
+
+            # Optional: Print full product details
+            logger.debug(f"Full product details:\n" f"{product.model_dump_json(indent=2)}")
+
     except Exception as e:
         logger.error(f"Error in main: {str(e)}", exc_info=True)
 
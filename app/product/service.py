@@ -1,8 +1,18 @@
+import asyncio
+from urllib.parse import urlsplit
+
+from loguru import logger
 from product.model import Product
 from product.parser import parse_amazon_product
 
+from app.scraper.bright_data.amazon import Product as AmazonProduct
 from app.scraper.bright_data.amazon import scrape_amazon_product
 
+# Maximum number of products parsed concurrently, across all get_products calls
+PARSE_CONCURRENCY = 8
+
+_parse_semaphore = asyncio.Semaphore(PARSE_CONCURRENCY)
+
 
 def is_amazon_url(url: str) -> bool:
     """Check if the URL is from Amazon
@@ -13,7 +23,13 @@ def is_amazon_url(url: str) -> bool:
     Returns:
         bool: True if URL is from Amazon, False otherwise
     """
-    return "amazon." in url.lower()
+    # hostname is already lowercased, and checking it alone avoids matching "amazon." in paths or query strings
+    parts = urlsplit(url)
+    if not parts.netloc:
+        # Scheme-less URLs such as "amazon.com/dp/..." only parse their host after a leading "//"
+        parts = urlsplit(f"//{url}")
+    host = parts.hostname or ""
+    return host.startswith("amazon.") or ".amazon." in host
 
 
 async def get_product(url: str) -> Product | None:
@@ -28,10 +44,49 @@ async def get_product(url: str) -> Product | None:
     Raises:
         ValueError: If website is not supported
     """
-    if not is_amazon_url(url):
-        raise ValueError("Only Amazon products are supported")
+    (product,) = await get_products([url])
+    return product
+
 
-    response = await scrape_amazon_product([url])
-    if not response or not response.products:
+def _parse_or_none(amazon_product: AmazonProduct) -> Product | None:
+    """Parse a scraped product, logging and skipping it on failure"""
+    try:
+        return parse_amazon_product(amazon_product)
+    except Exception as e:
+        logger.error(f"Error parsing product {amazon_product.url}: {str(e)}")
         return None
-    return parse_amazon_product(response.products[0])
+
+
+async def get_products(urls: list[str]) -> list[Product | None]:
+    """Get product metadata for multiple URLs with a single batched scrape
+
+    Args:
+        urls: Product URLs to scrape
+
+    Returns:
+        list[Product | None]: Parsed products in the order of urls,
+            None for URLs that were not scraped or failed to parse
+
+    Raises:
+        ValueError: If any website is not supported
+    """
+    if not all(is_amazon_url(url) for url in urls):
+        raise ValueError("Only Amazon products are supported")
+
+    response = await scrape_amazon_product(urls)
+
+    # Scraped products can come back in any order or not at all, so match them to the URL they were requested with.
+    # The product url can gain query parameters, so prefer the echoed input url
+    scraped: dict[str | None, AmazonProduct] = {}
+    for amazon_product in response.products if response else []:
+        scraped.setdefault(amazon_product.input.get("url", amazon_product.url), amazon_product)
+
+    # Parse off the event loop so large batches don't block other requests,
+    # sharing one semaphore so concurrent requests are bounded together
+    async def parse(amazon_product: AmazonProduct | None) -> Product | None:
+        if amazon_product is None:
+            return None
+        async with _parse_semaphore:
+            return await asyncio.to_thread(_parse_or_none, amazon_product)
+
+    return list(await asyncio.gather(*(parse(scraped.get(url)) for url in urls)))
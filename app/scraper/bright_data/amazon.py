@@ -2,11 +2,10 @@ import asyncio
 from datetime import datetime
 from typing import Any
 
-import httpx
 from loguru import logger
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-from app.config import get_settings
+from app.scraper.bright_data.client import auth_headers, get_client
 from app.scraper.bright_data.management_api import get_snapshot_status
 
 DATASET_ID = "gd_l7q7dkf244hwjntr0"
@@ -238,27 +237,20 @@ async def get_snapshot_data(snapshot_id: str) -> list[dict[str, Any]] | None:
     Returns:
         List of product data dictionaries or None if failed
     """
-    settings = get_settings()
-    token = settings.BRIGHT_DATA_TOKEN
-    if not token:
-        raise ValueError("BRIGHT_DATA_TOKEN not found in settings")
-
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    snapshot_url = "https://api.brightdata.com/datasets/v3/snapshot" f"/{snapshot_id}?format=json"
-
-    async with httpx.AsyncClient() as client:
-        try:
-            snapshot_response = await client.get(snapshot_url, headers=headers)
-            snapshot_response.raise_for_status()
-
-            raw_data: list[dict[str, Any]] = snapshot_response.json()
-            if raw_data and len(raw_data) > 0:
-                return raw_data
-            return None
+    headers = auth_headers()
 
-        except Exception as e:
-            logger.error(f"Failed to get snapshot data: {str(e)}")
-            return None
+    try:
+        snapshot_response = await get_client().get(f"/datasets/v3/snapshot/{snapshot_id}", params={"format": "json"}, headers=headers)
+        snapshot_response.raise_for_status()
+
+        raw_data: list[dict[str, Any]] = snapshot_response.json()
+        if raw_data and len(raw_data) > 0:
+            return raw_data
+        return None
+
+    except Exception as e:
+        logger.error(f"Failed to get snapshot data: {str(e)}")
+        return None
 
 
 async def scrape_amazon_product(urls: list[str]) -> ProductResponse | None:
@@ -272,53 +264,47 @@ async def scrape_amazon_product(urls: list[str]) -> ProductResponse | None:
         ProductResponse object containing scraped data or None if failed
     """
     try:
-        settings = get_settings()
-        token = settings.BRIGHT_DATA_TOKEN
-        if not token:
-            raise ValueError("BRIGHT_DATA_TOKEN not found in settings")
-
-        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-        trigger_url = "https://api.brightdata.com/datasets/v3/trigger" f"?dataset_id={DATASET_ID}&include_errors=true"
+        headers = auth_headers()
 
         url_list = [{"url": url} for url in urls]
 
-        async with httpx.AsyncClient() as client:
-            trigger_response = await client.post(trigger_url, headers=headers, json=url_list)
-            trigger_response.raise_for_status()
+        trigger_response = await get_client().post(
+            "/datasets/v3/trigger", params={"dataset_id": DATASET_ID, "include_errors": "true"}, headers=headers, json=url_list
+        )
+        trigger_response.raise_for_status()
 
-            snapshot_id = trigger_response.json()["snapshot_id"]
-            logger.info(f"Triggered scraping with snapshot ID: {snapshot_id}")
+        snapshot_id = trigger_response.json()["snapshot_id"]
+        logger.info(f"Triggered scraping with snapshot ID: {snapshot_id}")
 
-            # Wait for scraping to complete
-            wait_time = 0
-            while wait_time < MAX_WAIT_TIME:
-                status = await get_snapshot_status(snapshot_id)
+        # Wait for scraping to complete
+        wait_time = 0
+        while wait_time < MAX_WAIT_TIME:
+            status = await get_snapshot_status(snapshot_id)
 
-                if not status:
-                    raise ValueError("Failed to get snapshot status")
+            if not status:
+                raise ValueError("Failed to get snapshot status")
 
-                if status.status == "ready":
-                    duration_str = f" in {status.collection_duration/1000:.1f} seconds" if status.collection_duration else ""
-                    records_str = f" with {status.records} records" if status.records is not None else ""
-                    logger.info(f"Scraping completed{records_str}{duration_str}")
-                    break
+            if status.status == "ready":
+                duration_str = f" in {status.collection_duration/1000:.1f} seconds" if status.collection_duration else ""
+                records_str = f" with {status.records} records" if status.records is not None else ""
+                logger.info(f"Scraping completed{records_str}{duration_str}")
+                break
 
-                if status.status == "error":
-                    raise ValueError("Scraping failed with errors")
+            if status.status == "error":
+                raise ValueError("Scraping failed with errors")
 
-                logger.info(f"Scraping in progress... " f"(waited {wait_time} seconds)")
-                await asyncio.sleep(POLL_INTERVAL)
-                wait_time += POLL_INTERVAL
-            else:
-                raise TimeoutError("Scraping timed out")
+            logger.info(f"Scraping in progress... " f"(waited {wait_time} seconds)")
+            await asyncio.sleep(POLL_INTERVAL)
+            wait_time += POLL_INTERVAL
+        else:
+            raise TimeoutError("Scraping timed out")
 
-            # Get snapshot data
-            raw_data = await get_snapshot_data(snapshot_id)
-            if raw_data:
-                return ProductResponse(products=raw_data)
+        # Get snapshot data
+        raw_data = await get_snapshot_data(snapshot_id)
+        if raw_data:
+            return ProductResponse(products=raw_data)
 
-            return None
+        return None
 
     except Exception as e:
         logger.error(f"Error occurred: {str(e)}")
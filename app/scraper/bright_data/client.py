@@ -0,0 +1,55 @@
+"""Shared HTTP client for the Bright Data API"""
+
+from functools import lru_cache
+
+import httpx
+
+from app.config import get_settings
+
+BRIGHT_DATA_API_URL = "https://api.brightdata.com"
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared Bright Data client, creating it on first use
+
+    Returns:
+        httpx.AsyncClient with a pooled HTTP/2 connection to the Bright Data API
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=BRIGHT_DATA_API_URL,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(30.0),
+            headers={"Content-Type": "application/json"},
+        )
+    return _client
+
+
+@lru_cache(maxsize=1)
+def auth_headers() -> dict[str, str]:
+    """
+    Get the Bright Data authorization headers, reading the token once
+
+    Returns:
+        Headers with the bearer token
+
+    Raises:
+        ValueError: If BRIGHT_DATA_TOKEN is not set
+    """
+    token = get_settings().BRIGHT_DATA_TOKEN
+    if not token:
+        raise ValueError("BRIGHT_DATA_TOKEN not found in settings")
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def close_client() -> None:
+    """Close the shared Bright Data client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
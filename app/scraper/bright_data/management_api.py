@@ -1,8 +1,8 @@
 import httpx
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from app.config import get_settings
+from app.scraper.bright_data.client import auth_headers, get_client
 
 
 class SnapshotStatus(BaseModel):
@@ -31,6 +31,10 @@ class SnapshotInfo(BaseModel):
     created: str | None = None
 
 
+# Validates the snapshot list straight from the response bytes
+SNAPSHOT_LIST_ADAPTER = TypeAdapter(list[SnapshotInfo])
+
+
 async def get_snapshot_status(snapshot_id: str) -> SnapshotStatus | None:
     """
     Get status of a specific snapshot
@@ -41,21 +45,18 @@ async def get_snapshot_status(snapshot_id: str) -> SnapshotStatus | None:
     Returns:
         SnapshotStatus object or None if failed
     """
-    settings = get_settings()
-    token = settings.BRIGHT_DATA_TOKEN
-    if not token:
-        raise ValueError("BRIGHT_DATA_TOKEN not found in settings")
+    headers = auth_headers()
+    response: httpx.Response | None = None
 
     try:
-        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"https://api.brightdata.com/datasets/v3/progress/{snapshot_id}", headers=headers)
-            response.raise_for_status()
-            return SnapshotStatus(**response.json())
+        response = await get_client().get(f"/datasets/v3/progress/{snapshot_id}", headers=headers)
+        response.raise_for_status()
+        return SnapshotStatus.model_validate_json(response.content)
 
     except Exception as e:
-        logger.error(f"Failed to get snapshot status: {str(e)}, response: {response.json()}")
+        # The body may be missing (network error) or not JSON (the likely cause of the failure), so log it raw
+        body = response.text if response is not None else None
+        logger.error(f"Failed to get snapshot status: {str(e)}, response: {body}")
         return None
 
 
@@ -70,20 +71,12 @@ async def list_snapshots(dataset_id: str, status: str = "ready") -> list[Snapsho
     Returns:
         List of SnapshotInfo objects or None if failed
     """
-    settings = get_settings()
-    token = settings.BRIGHT_DATA_TOKEN
-    if not token:
-        raise ValueError("BRIGHT_DATA_TOKEN not found in settings")
+    headers = auth_headers()
 
     try:
-        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.brightdata.com/datasets/v3/snapshots" f"?dataset_id={dataset_id}&status={status}", headers=headers
-            )
-            response.raise_for_status()
-            return [SnapshotInfo(**item) for item in response.json()]
+        response = await get_client().get("/datasets/v3/snapshots", params={"dataset_id": dataset_id, "status": status}, headers=headers)
+        response.raise_for_status()
+        return SNAPSHOT_LIST_ADAPTER.validate_json(response.content)
 
     except Exception as e:
         logger.error(f"Failed to list snapshots: {str(e)}")
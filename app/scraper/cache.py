@@ -1,83 +1,109 @@
 """Cache module for storing scrape results"""
 
-import json
+import asyncio
+import atexit
+import sqlite3
 import time
 from pathlib import Path
 from typing import Any
 
 import logfire
-from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 
 from app.config import get_settings
 
-
-class CacheEntry(BaseModel):
-    """Cache entry with timestamp"""
-
-    data: dict[str, Any]
-    timestamp: float
+# Seconds to collect writes before flushing them to disk in one transaction
+FLUSH_DELAY = 1.0
 
 
 class ScrapeCache:
-    """Local cache for scrape results"""
+    """Local cache for scrape results, stored in SQLite so each write touches a single row"""
 
-    def __init__(self, cache_file: str = "scrape_cache.json"):
+    def __init__(self, cache_file: str = "scrape_cache.sqlite"):
         self.cache_dir = Path("cache")
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_file = self.cache_dir / cache_file
-        self.settings = get_settings()
-        self.cache: dict[str, CacheEntry] = {}
-        self._load_cache()
+        self.conn = sqlite3.connect(self.cache_file, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS cache (url TEXT PRIMARY KEY, data BLOB NOT NULL, timestamp REAL NOT NULL)")
+        # Writes not yet flushed to disk, keyed by URL
+        self._pending: dict[str, tuple[bytes, float]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def _save_pending(self) -> None:
+        """Write all pending entries in a single transaction"""
+        if not self._pending:
+            return
 
-    def _load_cache(self) -> None:
-        """Load cache from file"""
+        rows = [(url, data, timestamp) for url, (data, timestamp) in self._pending.items()]
         try:
-            if self.cache_file.exists():
-                data = json.loads(self.cache_file.read_text())
-                self.cache = {k: CacheEntry(**v) for k, v in data.items()}
-                logfire.info(f"Loaded {len(self.cache)} entries from cache")
+            self.conn.execute("BEGIN")
+            self.conn.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", rows)
+            self.conn.execute("COMMIT")
         except Exception as e:
-            logfire.error(f"Failed to load cache: {str(e)}")
-            self.cache = {}
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            # Entries stay pending, so the next flush retries them
+            logfire.error(f"Failed to save cache: {str(e)}")
+            return
+
+        self._pending.clear()
 
-    def _save_cache(self) -> None:
-        """Save cache to file"""
+    async def _flush_later(self) -> None:
+        """Flush pending entries after FLUSH_DELAY"""
+        await asyncio.sleep(FLUSH_DELAY)
+        self._save_pending()
+
+    def _schedule_flush(self) -> None:
+        """Flush in the background when called from an event loop, otherwise immediately"""
         try:
-            cache_data = {k: v.model_dump() for k, v in self.cache.items()}
-            self.cache_file.write_text(json.dumps(cache_data, indent=2))
-            logfire.info(f"Saved {len(self.cache)} entries to cache")
-        except Exception as e:
-            logfire.error(f"Failed to save cache: {str(e)}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_pending()
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Write pending entries now"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._save_pending()
 
     def get(self, url: str) -> dict[str, Any] | None:
         """Get cached data for URL if not expired"""
-        if not self.settings.ENABLE_CACHE:
+        settings = get_settings()
+        if not settings.ENABLE_CACHE:
             return None
 
-        entry = self.cache.get(url)
-        if not entry:
+        row = self._pending.get(url) or self.conn.execute("SELECT data, timestamp FROM cache WHERE url = ?", (url,)).fetchone()
+        if not row:
             return None
 
         # Check if cache entry has expired
-        age = time.time() - entry.timestamp
-        if age > self.settings.CACHE_TTL:
-            logfire.info(f"Cache expired for {url}")
-            del self.cache[url]
-            self._save_cache()
+        data, timestamp = row
+        age = time.time() - timestamp
+        if age > settings.CACHE_TTL:
+            logfire.debug("Cache expired for {url}", url=url)
+            self._pending.pop(url, None)
+            self.conn.execute("DELETE FROM cache WHERE url = ?", (url,))
             return None
 
-        logfire.info(f"Cache hit for {url}")
-        return entry.data
+        logfire.debug("Cache hit for {url}", url=url)
+        return from_json(data)
 
     def set(self, url: str, data: dict[str, Any]) -> None:
-        """Set cache data for URL"""
-        if not self.settings.ENABLE_CACHE:
+        """Set cache data for URL, writing it to disk with the next flush"""
+        if not get_settings().ENABLE_CACHE:
             return
 
-        self.cache[url] = CacheEntry(data=data, timestamp=time.time())
-        self._save_cache()
-        logfire.info(f"Cached data for {url}")
+        self._pending[url] = (to_json(data), time.time())
+        self._schedule_flush()
+        logfire.debug("Cached data for {url}", url=url)
 
 
-# Global cache instance
+# Global cache instance, whose pending writes are saved at exit if the app's shutdown hook didn't flush them
 scrape_cache = ScrapeCache()
+atexit.register(scrape_cache._save_pending)
@@ -1,24 +1,58 @@
 import asyncio
+import atexit
+import codecs
+import io
+import multiprocessing
+import random
 import re
+import tarfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from xml.etree.ElementTree import Element
+from urllib.parse import urlsplit, urlunsplit
 
-import chardet
-import html5lib
+import charset_normalizer
 import httpx
 import logfire
 from fake_headers import Headers
 from loguru import logger
+from pydantic_core import from_json, to_json
 
 from app.config import get_settings
-from app.llm.func.summarizer import generate_summary
+from app.scraper.crawler.markdown_converter import html_to_markdown
 from app.scraper.oxylabs.universal.scraper import fetch_universal
 from app.scraper.reddit.json_parser import convert_reddit_json_to_markdown
+from app.scraper.utils import debug_file_name
 from app.scraper.youtube.transcript import aget_transcript
 from app.utils.counter import crawler_counter
 
+# Video ID from youtube.com/watch?v=<id> or youtu.be/<id> links
+YOUTUBE_ID_RE = re.compile(r"(?:youtube\.com/watch\?v=|youtu\.be/)([A-Za-z0-9_-]+)")
+
+# Bare URLs, and markdown links (capturing the link text) or bare URLs, removed by sanitize_markdown_links
+BARE_URL_RE = re.compile(r"https?://\S+")
+MARKDOWN_LINK_OR_URL_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)|https?://\S+")
+
+# Number of randomized browser header sets rotated by fetch_direct
+HEADER_POOL_SIZE = 32
+
+# Content codings advertised by fetch_direct, all decoded by httpx (brotli is a project dependency),
+# so servers without Brotli still compress instead of falling back to an uncompressed body
+ACCEPT_ENCODING = "br, gzip, deflate"
+
+# Bytes of a response body sampled for encoding detection
+ENCODING_SNIFF_BYTES = 64 * 1024
+
+# Tar archive collecting the HTML and markdown saved by save_debug_files
+DEBUG_ARCHIVE = Path("debug") / "crawler_debug.tar"
+
+_markdown_pool: ProcessPoolExecutor | None = None
+_debug_tar: tarfile.TarFile | None = None
+_debug_lock = threading.Lock()
+
 
 class OutputFormat(str, Enum):
     """Output format options for HTML content"""
@@ -28,37 +62,58 @@ class OutputFormat(str, Enum):
     SUMMARY = "summary"
 
 
-def save_debug_files(url: str, html: str, markdown: str | None) -> None:
+def _debug_archive() -> tarfile.TarFile:
+    """Open the shared debug archive for appending on first use"""
+    global _debug_tar
+    if _debug_tar is None:
+        DEBUG_ARCHIVE.parent.mkdir(exist_ok=True)
+        _debug_tar = tarfile.open(DEBUG_ARCHIVE, "a")
+        atexit.register(_debug_tar.close)
+    return _debug_tar
+
+
+def _write_debug_members(members: list[tuple[str, str]]) -> None:
+    """Append named text members to the debug archive and flush it to disk"""
+    with _debug_lock:
+        archive = _debug_archive()
+        for name, text in members:
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            archive.addfile(info, io.BytesIO(data))
+        archive.fileobj.flush()  # type: ignore[union-attr]
+
+
+async def save_debug_files(url: str, html: str, markdown: str | None) -> None:
     """
-    Save HTML and markdown content to debug files
+    Append HTML and markdown content to the debug archive
+
+    All debug output goes into a single tar file instead of two small files per URL,
+    written from a worker thread so it overlaps with in-flight fetches.
 
     Args:
         url: Source URL for naming
         html: HTML content
         markdown: Markdown content
     """
-    # Create debug directory if not exists
-    debug_dir = Path("debug")
-    debug_dir.mkdir(exist_ok=True)
-
-    # Create safe filename from URL
-    safe_name = "".join(c if c.isalnum() else "_" for c in url.split("//")[-1])[:100]
+    safe_name = debug_file_name(url)
 
-    # Save HTML content
-    html_path = debug_dir / f"{safe_name}.html"
-    html_path.write_text(html, encoding="utf-8")
-
-    # Save markdown content if available
+    # Save HTML content, plus markdown content if available
+    members = [(f"{safe_name}.html", html)]
     if markdown:
-        md_path = debug_dir / f"{safe_name}.md"
-        md_path.write_text(markdown, encoding="utf-8")
+        members.append((f"{safe_name}.md", markdown))
 
-    logger.info(f"Debug files saved for {url}")
+    await asyncio.to_thread(_write_debug_members, members)
+    logger.debug(f"Debug files saved for {url}")
 
 
 def autodetect(content: bytes) -> str:
     """
-    Detect character encoding of content using chardet
+    Detect character encoding of content using charset-normalizer
+
+    Only the first ENCODING_SNIFF_BYTES are analyzed, as detection time grows with input size.
+    httpx calls this only when the response has no usable charset in its Content-Type.
 
     Args:
         content: Bytes to analyze
@@ -66,11 +121,86 @@ def autodetect(content: bytes) -> str:
     Returns:
         Detected encoding or 'utf-8' as fallback
     """
-    result = chardet.detect(content)
+    sample = content[:ENCODING_SNIFF_BYTES]
+    try:
+        # Most pages are UTF-8, which a C-level decode confirms far faster than statistical detection.
+        # The incremental decoder tolerates a multi-byte character cut off at the end of the sample.
+        codecs.getincrementaldecoder("utf-8")().decode(sample)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    result = charset_normalizer.detect(sample)
     return result.get("encoding") or "utf-8"
 
 
-async def fetch_direct(url: str) -> str | None:
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared crawler client, creating it on first use
+
+    Returns:
+        httpx.AsyncClient with pooled HTTP/2 connections, reused across all fetches
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            # Keep idle connections longer than httpx's 5s default so they survive between batches
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(30.0),
+            follow_redirects=True,
+            default_encoding=autodetect,
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared crawler client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_markdown_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool for HTML to markdown conversion, creating it on first use
+
+    Returns:
+        ProcessPoolExecutor with one worker per CPU
+    """
+    global _markdown_pool
+    if _markdown_pool is None:
+        # Spawn rather than fork: forking would copy the parent's logging and telemetry threads mid-state
+        _markdown_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _markdown_pool
+
+
+def close_markdown_pool() -> None:
+    """Shut down the markdown conversion pool"""
+    global _markdown_pool
+    if _markdown_pool is not None:
+        _markdown_pool.shutdown(wait=False, cancel_futures=True)
+        _markdown_pool = None
+
+
+@lru_cache(maxsize=1)
+def browser_headers() -> tuple[dict[str, str], ...]:
+    """
+    Generate a pool of browser-like request headers once, to rotate between requests
+
+    Returns:
+        HEADER_POOL_SIZE randomized Chrome on Windows header sets
+    """
+    return tuple(
+        {**Headers(browser="chrome", os="windows", headers=True).generate(), "Accept-Encoding": ACCEPT_ENCODING} for _ in range(HEADER_POOL_SIZE)
+    )
+
+
+async def fetch_direct(url: str) -> tuple[str | None, int | None]:
     """
     Fetch content directly using httpx with HTTP/2 support
     and automatic encoding detection
@@ -79,39 +209,50 @@ async def fetch_direct(url: str) -> str | None:
         url: Target URL to fetch
 
     Returns:
-        HTML content if successful, None otherwise
+        HTML content (None on failure) and the response status code (None if no response was received)
     """
     try:
-        headers = Headers(browser="chrome", os="windows", headers=True).generate()
-        headers["Accept-Encoding"] = "br"
-
-        async with httpx.AsyncClient(
-            http2=True,
-            timeout=10.0,
-            follow_redirects=True,
-            default_encoding=autodetect,
-        ) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
+        response = await get_client().get(url, headers=random.choice(browser_headers()), timeout=10.0)
+        response.raise_for_status()
 
-            content = str(response.text)
-            crawler_counter.add(1, {"type": "direct", "status": "success", "status_code": response.status_code})
-            return content
+        content = response.text
+        crawler_counter.add(1, {"type": "direct", "status": "success", "status_code": response.status_code})
+        return content, response.status_code
 
     except httpx.HTTPStatusError as e:
-        # HTTPStatusError always has a response
-        logger.error(f"Direct request failed with status {e.response.status_code}: {e}")
+        # HTTPStatusError always has a response; the caller logs its status code
         crawler_counter.add(1, {"type": "direct", "status": "error", "error": "http", "status_code": e.response.status_code})
-        return None
+        return None, e.response.status_code
     except httpx.HTTPError as e:
         # Other HTTP errors may not have a response
-        logger.error(f"Direct request failed: {e}")
+        logger.error(f"Direct request to {url} failed: {e}")
         crawler_counter.add(1, {"type": "direct", "status": "error", "error": "http"})
-        return None
+        return None, None
     except Exception as e:
         logger.error(f"Direct request error: {e}", exc_info=True)
         crawler_counter.add(1, {"type": "direct", "status": "error", "error": "unknown"})
-        return None
+        return None, None
+
+
+@lru_cache(maxsize=1)
+def spider_headers() -> dict[str, str]:
+    """
+    Get the Spider API request headers, reading the key from settings once
+
+    Returns:
+        Headers with the bearer token
+
+    Raises:
+        ValueError: If SPIDER_API_KEY is not set
+    """
+    spider_api_key = get_settings().SPIDER_API_KEY
+    if not spider_api_key:
+        raise ValueError("SPIDER_API_KEY not found in settings")
+
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {spider_api_key}",
+    }
 
 
 async def fetch_with_spider(url: str) -> str | None:
@@ -125,36 +266,25 @@ async def fetch_with_spider(url: str) -> str | None:
         HTML content if successful, None otherwise
     """
     try:
-        settings = get_settings()
-        spider_api_key = settings.SPIDER_API_KEY
-        if not spider_api_key:
-            raise ValueError("SPIDER_API_KEY not found in settings")
-
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {spider_api_key}",
-        }
-
         json_data = {"url": url}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post("https://api.spider.cloud/crawl", headers=headers, json=json_data, timeout=30.0)
-            response.raise_for_status()
+        response = await get_client().post("https://api.spider.cloud/crawl", headers=spider_headers(), content=to_json(json_data), timeout=30.0)
+        response.raise_for_status()
 
-            result = response.json()
-            if not result or not isinstance(result, list):
-                logger.error("Invalid Spider API response format")
-                crawler_counter.add(1, {"type": "spider", "status": "error", "error": "format"})
-                return None
+        result = from_json(response.content)
+        if not result or not isinstance(result, list):
+            logger.error("Invalid Spider API response format")
+            crawler_counter.add(1, {"type": "spider", "status": "error", "error": "format"})
+            return None
 
-            content = result[0].get("content")
-            if not content:
-                logger.error("No content in Spider API response")
-                crawler_counter.add(1, {"type": "spider", "status": "error", "error": "empty"})
-                return None
+        content = result[0].get("content")
+        if not content:
+            logger.error("No content in Spider API response")
+            crawler_counter.add(1, {"type": "spider", "status": "error", "error": "empty"})
+            return None
 
-            crawler_counter.add(1, {"type": "spider", "status": "success"})
-            return str(content)
+        crawler_counter.add(1, {"type": "spider", "status": "success"})
+        return str(content)
 
     except httpx.HTTPError as e:
         logger.error(f"Spider API request failed: {e}")
@@ -166,6 +296,14 @@ async def fetch_with_spider(url: str) -> str | None:
         return None
 
 
+def _link_text(match: re.Match[str]) -> str:
+    """Replace a markdown link with its text, minus any URLs in it, and a bare URL with nothing"""
+    text = match.group(1)
+    if text is None:
+        return ""
+    return BARE_URL_RE.sub("", text) if "://" in text else text
+
+
 def sanitize_markdown_links(markdown: str) -> str:
     """
     Remove external links from markdown content while preserving text
@@ -179,15 +317,8 @@ def sanitize_markdown_links(markdown: str) -> str:
     if markdown is None:
         return None
 
-    # Replace markdown links with just the text
-    link_pattern = r"\[([^\]]+)\]\([^)]+\)"
-    sanitized = re.sub(link_pattern, r"\1", markdown)
-
-    # Replace bare URLs with empty string
-    url_pattern = r"https?://\S+"
-    sanitized = re.sub(url_pattern, "", sanitized)
-
-    return sanitized
+    # Replace markdown links with just the text and drop bare URLs in a single pass
+    return MARKDOWN_LINK_OR_URL_RE.sub(_link_text, markdown)
 
 
 async def fetch(
@@ -206,42 +337,46 @@ async def fetch(
         HTML, markdown, or summary content if successful, None otherwise
     """
     try:
-        logger.info(f"Fetching content from {'Spider API' if use_external_crawler else 'direct request'}: {url}")
+        logger.debug(f"Fetching content from {'Spider API' if use_external_crawler else 'direct request'}: {url}")
 
-        # Fetch content using appropriate method
-        content = await fetch_with_spider(url) if use_external_crawler else await fetch_direct(url)
+        # Fetch content using appropriate method, keeping the status code of the single direct request for diagnostics
+        status_code: int | None = None
+        if use_external_crawler:
+            content = await fetch_with_spider(url)
+        else:
+            content, status_code = await fetch_direct(url)
 
         if not content:
-            # If direct fetch failed, try to get status code for better debugging
-            if not use_external_crawler:
-                try:
-                    async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as client:
-                        response = await client.get(url)
-                        logger.error(f"Failed to fetch content from {url} (HTTP Status: {response.status_code})")
-                except Exception as e:
-                    logger.error(f"Failed to fetch content from {url} (Error: {str(e)})")
+            if status_code is not None:
+                logger.error(f"Failed to fetch content from {url} (HTTP Status: {status_code})")
             else:
-                logger.error(f"Failed to fetch content from {url} using Spider API")
+                # The fetchers already log transport errors, so don't request the URL again
+                logger.error(f"Failed to fetch content from {url} using {'Spider API' if use_external_crawler else 'direct request'}")
             return None
 
         # Convert to markdown first if needed
         if output_format in (OutputFormat.MARKDOWN, OutputFormat.SUMMARY):
-            markdown_content = html_to_markdown(content)
+            # Parsing is CPU bound, so run it in a worker process to convert pages in parallel.
+            # The converter lives in its own module so spawned workers don't import the whole crawler stack.
+            markdown_content = await asyncio.get_running_loop().run_in_executor(get_markdown_pool(), html_to_markdown, content)
             if not markdown_content:
                 logger.error("Failed to convert HTML to markdown")
                 return None
 
             if save_debug:
-                save_debug_files(url, content, markdown_content)
+                await save_debug_files(url, content, markdown_content)
 
             # Generate summary if requested
             if output_format == OutputFormat.SUMMARY:
+                # Imported lazily: the LLM client stack is slow to import and only needed here
+                from app.llm.func.summarizer import generate_summary
+
                 return await generate_summary(markdown_content)  # type: ignore
 
             return markdown_content
 
         if save_debug:
-            save_debug_files(url, content, None)
+            await save_debug_files(url, content, None)
         return content
 
     except Exception as e:
@@ -249,167 +384,6 @@ async def fetch(
         return None
 
 
-def html_to_markdown(html_content: str) -> str | None:
-    """
-    Convert HTML content to markdown format, preserving important content and structure
-    while removing unnecessary elements.
-
-    Args:
-        html_content: Raw HTML string to convert
-
-    Returns:
-        Markdown formatted string or None if conversion fails
-    """
-    if not html_content:
-        return None
-
-    try:
-        document = html5lib.parse(html_content)
-        result = []
-        seen_texts = set()  # To avoid duplicates
-
-        def should_skip_element(elem: Element) -> bool:
-            """Check if the element should be skipped."""
-            tag_str = str(elem.tag)
-            # Skip common non-content elements
-            skip_tags = {
-                "{http://www.w3.org/1999/xhtml}script",
-                "{http://www.w3.org/1999/xhtml}style",
-                "{http://www.w3.org/1999/xhtml}nav",
-                "{http://www.w3.org/1999/xhtml}footer",
-                "{http://www.w3.org/1999/xhtml}header",
-                "{http://www.w3.org/1999/xhtml}aside",
-            }
-            if tag_str in skip_tags:
-                return True
-
-            if not any(text.strip() for text in elem.itertext()):
-                return True
-
-            return False
-
-        def get_heading_level(tag: str) -> int:
-            """Get markdown heading level from HTML heading tag."""
-            tag_str = str(tag)
-            if (
-                not tag_str.endswith("}h1")
-                and not tag_str.endswith("}h2")
-                and not tag_str.endswith("}h3")
-                and not tag_str.endswith("}h4")
-                and not tag_str.endswith("}h5")
-                and not tag_str.endswith("}h6")
-            ):
-                return 0
-            return int(tag_str[-1])
-
-        def process_element(elem: Any, depth: int = 0) -> None:
-            """Process an element and its children recursively."""
-            if should_skip_element(elem):
-                return
-
-            # Handle text content
-            if hasattr(elem, "text") and elem.text:
-                text = elem.text.strip()
-                if text and text not in seen_texts:
-                    prefix = ""
-                    tag_str = str(elem.tag)
-
-                    # Handle headings
-                    heading_level = get_heading_level(tag_str)
-                    if heading_level > 0:
-                        prefix = "#" * heading_level + " "
-
-                    # Handle lists
-                    elif tag_str.endswith("}li"):
-                        prefix = "* "
-
-                    # Handle links
-                    if tag_str == "{http://www.w3.org/1999/xhtml}a":
-                        href = None
-                        for attr, value in elem.attrib.items():
-                            if str(attr).endswith("href"):
-                                href = value
-                                break
-                        if href and not str(href).startswith(("#", "javascript:", "mailto:")):
-                            result.append("  " * depth + prefix + f"[{text}]({href})")
-                            seen_texts.add(text)
-                            return
-
-                    # Handle emphasis
-                    elif tag_str.endswith("}strong") or tag_str.endswith("}b"):
-                        text = f"**{text}**"
-                    elif tag_str.endswith("}em") or tag_str.endswith("}i"):
-                        text = f"*{text}*"
-
-                    # Add text with appropriate prefix
-                    result.append("  " * depth + prefix + text)
-                    seen_texts.add(text)
-
-            # Process children
-            for child in elem:
-                process_element(child, depth + 1)
-
-            # Handle tail text
-            if hasattr(elem, "tail") and elem.tail:
-                tail = elem.tail.strip()
-                if tail and tail not in seen_texts:
-                    result.append("  " * depth + tail)
-                    seen_texts.add(tail)
-
-        # Find main content area if possible
-        main_content = (
-            document.find(".//{http://www.w3.org/1999/xhtml}main")
-            or document.find(".//{http://www.w3.org/1999/xhtml}article")
-            or document.find(".//{http://www.w3.org/1999/xhtml}body")
-        )
-
-        if main_content is not None:
-            process_element(main_content)
-        else:
-            # Fallback to processing the entire document
-            process_element(document)
-
-        # Filter out unwanted content
-        filtered_result = []
-        for line in result:
-            # Skip lines that are likely to be noise
-            skip_patterns = {
-                "var ",
-                "function()",
-                ".js",
-                ".css",
-                "google-analytics",
-                "disqus",
-                "{",
-                "}",
-                "undefined",
-                "null",
-                "NaN",
-                "cookie",
-                "privacy policy",
-                "terms of service",
-                "all rights reserved",
-                "copyright ©",
-            }
-            if not any(pattern in str(line).lower() for pattern in skip_patterns):
-                filtered_result.append(line)
-
-        # Clean up the result
-        markdown = "\n".join(filtered_result)
-
-        # Remove excessive newlines
-        markdown = "\n".join(line for line in markdown.splitlines() if line.strip())
-
-        # Ensure proper spacing between sections
-        markdown = markdown.replace("\n\n\n", "\n\n")
-
-        return markdown
-
-    except Exception as e:
-        logger.error(f"Error converting HTML to markdown: {str(e)}")
-        return None
-
-
 def extract_youtube_id(url: str) -> str | None:
     """
     Extracts the YouTube video ID from a given URL.
@@ -420,11 +394,8 @@ def extract_youtube_id(url: str) -> str | None:
     Returns:
         The video ID if found, otherwise None.
     """
-    if "youtube.com/watch?v=" in url:
-        return url.split("v=")[-1].split("&")[0]
-    elif "youtu.be/" in url:
-        return url.split("/")[-1]
-    return None
+    match = YOUTUBE_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def convert_reddit_url_to_json(url: str) -> str:
@@ -436,21 +407,21 @@ def convert_reddit_url_to_json(url: str) -> str:
     Returns:
         JSON API URL
     """
-    # Remove trailing slash if present
-    if url.endswith("/"):
-        url = url[:-1]
+    # Work on the path alone, so share links like ".../title/?utm_source=share" keep a valid query
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/")
 
     # Add .json extension if not already present
-    if not url.endswith(".json"):
-        url = f"{url}.json"
+    if not path.endswith(".json"):
+        path = f"{path}.json"
 
-    return url
+    return urlunsplit(parts._replace(path=path, fragment=""))
 
 
 async def fetch_batch(
     urls: list[str],
     output_format: OutputFormat = OutputFormat.MARKDOWN,
-    save_debug: bool = True,
+    save_debug: bool | None = None,
     use_external_crawler: bool = False,
     max_concurrent: int = 20,
 ) -> dict[str, str | None]:
@@ -460,59 +431,66 @@ async def fetch_batch(
     Args:
         urls: List of URLs to fetch
         output_format: Desired output format
-        save_debug: Whether to save debug files
+        save_debug: Whether to save debug files, defaulting to the SAVE_DEBUG_FILES setting
         use_external_crawler: Whether to use Spider API
         max_concurrent: Maximum number of concurrent requests
 
     Returns:
         Dictionary mapping URLs to their content
     """
-    results: dict[str, str | None] = {}
+    if save_debug is None:
+        save_debug = get_settings().SAVE_DEBUG_FILES
+
+    # URLs differing only by fragment or trailing slash are the same page, so fetch and convert each page once
+    page_keys = [url.split("#")[0].rstrip("/") for url in urls]
+    pages: dict[str, str] = {}
+    for url, key in zip(urls, page_keys, strict=True):
+        pages.setdefault(key, url)
 
-    # Process URLs in batches to limit concurrency
-    for i in range(0, len(urls), max_concurrent):
-        batch = urls[i : i + max_concurrent]
-        tasks = []
+    results: dict[str, str | None] = {}
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-        for url in batch:
+    async def fetch_one(url: str) -> str | None:
+        """Fetch one URL with the handler for its site, holding a concurrency slot"""
+        async with semaphore:
             youtube_id = extract_youtube_id(url)
             if youtube_id:
                 # Call transcript function for YouTube links
-                tasks.append(aget_transcript(youtube_id))
-            elif "reddit.com" in url:
+                return await aget_transcript(youtube_id)
+            if "reddit.com" in url:
                 # Convert Reddit URL to JSON API URL and fetch with universal fetcher
                 json_url = convert_reddit_url_to_json(url)
-                logger.info(f"Converting Reddit URL to JSON API: {url} -> {json_url}")
-                tasks.append(fetch_universal(json_url))
-            else:
-                # Fetch HTML content for non-YouTube links
-                tasks.append(fetch(url, output_format, save_debug, use_external_crawler))
-
-        # Wait for batch completion
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Map results to URLs
-        for url, result in zip(batch, batch_results, strict=False):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to fetch {url}: {str(result)}")
+                logger.debug(f"Converting Reddit URL to JSON API: {url} -> {json_url}")
+                return await fetch_universal(json_url)
+            # Fetch HTML content for non-YouTube links
+            return await fetch(url, output_format, save_debug, use_external_crawler)
+
+    # A new fetch starts as soon as any slot frees up, so one slow URL doesn't hold back the rest
+    fetch_results = await asyncio.gather(*(fetch_one(url) for url in pages.values()), return_exceptions=True)
+
+    # Map results to URLs
+    for url, result in zip(pages.values(), fetch_results, strict=False):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to fetch {url}: {str(result)}")
+            results[url] = None
+        elif "reddit.com" in url and isinstance(result, str):
+            # Process Reddit JSON content
+            try:
+                markdown = convert_reddit_json_to_markdown(result)
+                # Remove links from Reddit markdown
+                markdown = sanitize_markdown_links(markdown)
+                results[url] = markdown
+            except Exception as e:
+                logger.error(f"Failed to convert Reddit JSON to markdown: {e}")
                 results[url] = None
-            elif "reddit.com" in url and isinstance(result, str):
-                # Process Reddit JSON content
-                try:
-                    markdown = convert_reddit_json_to_markdown(result)
-                    # Remove links from Reddit markdown
-                    markdown = sanitize_markdown_links(markdown)
-                    results[url] = markdown
-                except Exception as e:
-                    logger.error(f"Failed to convert Reddit JSON to markdown: {e}")
-                    results[url] = None
-            else:
-                # Remove links from regular markdown content
-                if isinstance(result, str) and output_format == OutputFormat.MARKDOWN:
-                    result = sanitize_markdown_links(result)
-                results[url] = result
+        else:
+            # Remove links from regular markdown content
+            if isinstance(result, str) and output_format == OutputFormat.MARKDOWN:
+                result = sanitize_markdown_links(result)
+            results[url] = result
 
-    return results
+    # Give repeated URLs the result of the page fetched for them
+    return {url: results[pages[key]] for url, key in zip(urls, page_keys, strict=True)}
 
 
 if __name__ == "__main__":
@@ -520,9 +498,17 @@ if __name__ == "__main__":
 
     logfire.configure()
 
+    async def main(urls: list[str]) -> dict[str, str | None]:
+        """Fetch the URLs, closing the shared client while its event loop is still running"""
+        try:
+            return await fetch_batch(urls=urls, output_format=OutputFormat.MARKDOWN, save_debug=True)
+        finally:
+            await close_client()
+            close_markdown_pool()
+
     # Test Reddit URL
     reddit_url = "https://www.travelandleisure.com/best-samsonite-luggage-6835399"
-    results = asyncio.run(fetch_batch(urls=[reddit_url], output_format=OutputFormat.MARKDOWN, save_debug=True))
+    results = asyncio.run(main([reddit_url]))
 
     # Print results
     for url, content in results.items():
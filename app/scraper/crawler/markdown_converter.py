@@ -0,0 +1,210 @@
+"""Conversion of crawled HTML pages to markdown"""
+
+from typing import Any
+
+import html5lib
+from loguru import logger
+from lxml import etree
+
+# Non-content elements skipped when converting HTML to markdown
+SKIP_TAGS = frozenset(("script", "style", "nav", "footer", "header", "aside"))
+
+# Markdown heading prefix by heading tag
+HEADING_PREFIXES = {f"h{level}": "#" * level + " " for level in range(1, 7)}
+
+# Indentation added per level of element nesting in converted markdown
+INDENT = "  "
+
+# Lines containing any of these substrings (in any case) are dropped from the markdown as likely noise
+NOISE_PATTERNS = (
+    "var ",
+    "function()",
+    ".js",
+    ".css",
+    "google-analytics",
+    "disqus",
+    "{",
+    "}",
+    "undefined",
+    "null",
+    "cookie",
+    "privacy policy",
+    "terms of service",
+    "all rights reserved",
+    "copyright ©",
+)
+
+
+def parse_html(html_content: str) -> Any:
+    """
+    Parse an HTML document into an element tree with plain (non-namespaced) tag names
+
+    Uses lxml's C parser, falling back to html5lib for input lxml rejects,
+    such as strings carrying an XML encoding declaration.
+    Plain etree elements are used rather than lxml.html's, whose element class
+    lookup runs Python code for every element the walker touches.
+
+    Args:
+        html_content: Raw HTML string
+
+    Returns:
+        Root element of the document
+    """
+    try:
+        document = etree.HTML(html_content)
+    except ValueError:
+        document = None
+
+    if document is None:
+        return html5lib.parse(html_content, namespaceHTMLElements=False)
+    return document
+
+
+def elements_with_text(root: Any) -> set[Any]:
+    """
+    Find the elements with non-whitespace text below them, in a single bottom-up pass
+
+    Equivalent to checking any(text.strip() for text in elem.itertext()) for every element,
+    without re-scanning each subtree from all of its ancestors.
+
+    Args:
+        root: Root element of the tree to scan
+
+    Returns:
+        Set of the elements containing text
+    """
+    with_text: set[Any] = set()
+    # Reversed document order visits every element after all of its descendants
+    for elem in reversed(list(root.iter())):
+        # Comment and processing instruction text is not content, but their tails are
+        if not isinstance(elem.tag, str):
+            continue
+        if (elem.text and elem.text.strip()) or any(child in with_text or (child.tail and child.tail.strip()) for child in elem):
+            with_text.add(elem)
+    return with_text
+
+
+def should_skip_element(elem: Any, with_text: set[Any]) -> bool:
+    """Check if an element should be skipped when converting HTML to markdown"""
+    # Skip comments and processing instructions, whose tag is not a string
+    if not isinstance(elem.tag, str):
+        return True
+
+    # Skip common non-content elements
+    if elem.tag in SKIP_TAGS:
+        return True
+
+    # Skip elements without any text content
+    return elem not in with_text
+
+
+def is_noise(text: str) -> bool:
+    """Check if converted text contains any of the noise patterns, ignoring case"""
+    # Plain substring checks on the lowered text are several times faster than an IGNORECASE regex alternation,
+    # and a plain loop avoids creating a generator for every line
+    lowered = text.lower()
+    for pattern in NOISE_PATTERNS:
+        if pattern in lowered:
+            return True
+    return False
+
+
+def html_to_markdown(html_content: str) -> str | None:
+    """
+    Convert HTML content to markdown format, preserving important content and structure
+    while removing unnecessary elements.
+
+    Args:
+        html_content: Raw HTML string to convert
+
+    Returns:
+        Markdown formatted string or None if conversion fails
+    """
+    if not html_content:
+        return None
+
+    try:
+        document = parse_html(html_content)
+        lines: list[str] = []
+        # Hashes of emitted texts, to avoid duplicates without keeping a copy of every string
+        seen_texts: set[int] = set()
+
+        def emit(entry: str) -> None:
+            """Add the non-blank lines of an entry to the output, dropping noisy entries."""
+            if not is_noise(entry):
+                lines.extend(line for line in entry.splitlines() if line.strip())
+
+        def process_element(elem: Any) -> None:
+            """Process an element and its descendants in document order."""
+            # Entries are (element, indent, is_tail); an element's tail is emitted after its children.
+            # Each entry carries its indent, so children extend their parent's instead of rebuilding it from the depth.
+            stack: list[tuple[Any, str, bool]] = [(elem, "", False)]
+            with_text = elements_with_text(elem)
+            while stack:
+                elem, indent, is_tail = stack.pop()
+
+                # Handle tail text
+                if is_tail:
+                    tail = elem.tail.strip()
+                    tail_hash = hash(tail)
+                    if tail and tail_hash not in seen_texts:
+                        emit(f"{indent}{tail}")
+                        seen_texts.add(tail_hash)
+                    continue
+
+                if should_skip_element(elem, with_text):
+                    continue
+
+                # Handle text content
+                if elem.text:
+                    text = elem.text.strip()
+                    text_hash = hash(text)
+                    if text and text_hash not in seen_texts:
+                        # should_skip_element has already checked that the tag is a plain string
+                        tag = elem.tag
+
+                        # Handle headings and lists
+                        prefix = HEADING_PREFIXES.get(tag) or ("* " if tag == "li" else "")
+
+                        # Handle links
+                        if tag == "a":
+                            href = elem.get("href")
+                            if href and not href.startswith(("#", "javascript:", "mailto:")):
+                                emit(f"{indent}{prefix}[{text}]({href})")
+                                seen_texts.add(text_hash)
+                                continue
+
+                        # Handle emphasis, which is recorded as seen in its marked-up form
+                        elif tag in ("strong", "b"):
+                            text = f"**{text}**"
+                            text_hash = hash(text)
+                        elif tag in ("em", "i"):
+                            text = f"*{text}*"
+                            text_hash = hash(text)
+
+                        # Add text with appropriate prefix
+                        emit(f"{indent}{prefix}{text}")
+                        seen_texts.add(text_hash)
+
+                # Process children, then tail text, without recursing
+                if elem.tail:
+                    stack.append((elem, indent, True))
+                if len(elem):
+                    child_indent = indent + INDENT
+                    stack.extend((child, child_indent, False) for child in reversed(elem))
+
+        # Find main content area if possible
+        for path in (".//main", ".//article", ".//body"):
+            main_content = document.find(path)
+            if main_content is not None:
+                process_element(main_content)
+                break
+        else:
+            # Fallback to processing the entire document
+            process_element(document)
+
+        return "\n".join(lines)
+
+    except Exception as e:
+        logger.error(f"Error converting HTML to markdown: {str(e)}")
+        return None
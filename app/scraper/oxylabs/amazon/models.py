@@ -1,8 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from loguru import logger
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DeliveryDate(BaseModel):
@@ -199,26 +198,4 @@ class OxyAmazonProductResponse(BaseModel):
     job: QueryJob | None = None
     status_code: int | None = None
     status_message: str | None = None
-
-    @model_validator(mode="before")
-    def check_unknown_fields(cls, values: dict[str, Any]) -> dict[str, Any]:
-        """
-        Check for fields in raw JSON that aren't defined in the model
-
-        Args:
-            values: Raw dictionary of values
-
-        Returns:
-            Dict[str, Any]: Validated values
-        """
-        model_fields = cls.model_fields.keys()
-        unknown_fields = set(values.keys()) - set(model_fields)
-
-        if unknown_fields:
-            logger.warning("Found fields in JSON not defined in Product model: " f"{', '.join(unknown_fields)}")
-
-            # Log the values of unknown fields for analysis
-            for field in unknown_fields:
-                logger.warning(f"Unknown field '{field}' has value: {values[field]}")
-
-        return values
+    model_config = ConfigDict(extra="ignore")
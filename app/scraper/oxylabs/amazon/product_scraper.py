@@ -1,9 +1,11 @@
 import httpx
 from loguru import logger
 from pydantic import ValidationError
+from pydantic_core import from_json, to_json
 
 from app.config import get_settings
 from app.scraper.oxylabs.amazon.models import OxyAmazonProductResponse
+from app.scraper.oxylabs.client import get_client
 
 
 async def fetch_amazon_product(asin: str) -> OxyAmazonProductResponse:
@@ -30,18 +32,16 @@ async def fetch_amazon_product(asin: str) -> OxyAmazonProductResponse:
     if not username or not password:
         raise ValueError("Oxylabs credentials required. Set OXYLABS_USERNAME and " "OXYLABS_PASSWORD env vars or pass directly.")
 
-    url = "https://realtime.oxylabs.io/v1/queries"
     payload = {"source": "amazon_product", "query": asin, "parse": True}
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, auth=(username, password), timeout=30.0)
-            response.raise_for_status()
+        response = await get_client().post("/v1/queries", content=to_json(payload), auth=(username, password))
+        response.raise_for_status()
 
-            data = response.json()
-            logger.info(f"Successfully fetched data for ASIN: {asin}")
+        data = from_json(response.content)
+        logger.info(f"Successfully fetched data for ASIN: {asin}")
 
-            return OxyAmazonProductResponse(**data)
+        return OxyAmazonProductResponse.model_validate(data)
 
     except httpx.HTTPError as e:
         logger.error(f"HTTP error fetching product {asin}: {str(e)}, response: {response.text}")
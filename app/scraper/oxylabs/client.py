@@ -0,0 +1,34 @@
+"""Shared HTTP client for the Oxylabs realtime API"""
+
+import httpx
+
+OXYLABS_API_URL = "https://realtime.oxylabs.io"
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared Oxylabs client, creating it on first use
+
+    Returns:
+        httpx.AsyncClient with a pooled HTTP/2 connection to the Oxylabs realtime API
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=OXYLABS_API_URL,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(30.0),
+            headers={"Content-Type": "application/json"},
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Oxylabs client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,12 +1,13 @@
 from typing import Any
 
 import httpx
-import requests
 from dotenv import load_dotenv
 from loguru import logger
+from pydantic_core import from_json, to_json
 
 from app.config import get_settings
 from app.scraper.crawler.html_fetcher import OutputFormat, fetch_batch
+from app.scraper.oxylabs.client import get_client
 from app.scraper.oxylabs.google.models import OxyGoogleSearchResponse
 
 
@@ -19,19 +20,15 @@ async def search_google(query: str) -> dict[str, Any] | None:
     if not username or not password:
         raise ValueError("OXYLABS credentials not found in settings")
 
-    auth = httpx.BasicAuth(username, password)
-
-    url = "https://realtime.oxylabs.io/v1/queries"
-
     payload = {"source": "google_search", "domain": "com", "query": query, "parse": True}
 
     try:
-        response = requests.post(url, json=payload, auth=auth, timeout=30.0)
+        response = await get_client().post("/v1/queries", content=to_json(payload), auth=(username, password))
         response.raise_for_status()
 
-        return OxyGoogleSearchResponse(**response.json())
+        return OxyGoogleSearchResponse.model_validate(from_json(response.content))
 
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Request error occurred: {e}")
         return None
     except Exception as e:
@@ -1,6 +1,7 @@
 import httpx
 from dotenv import load_dotenv
 from loguru import logger
+from pydantic_core import from_json
 
 from app.config import get_settings
 from app.scraper.oxylabs.google_shopping.models import (
@@ -10,6 +11,7 @@ from app.scraper.oxylabs.google_shopping.models import (
     GoogleProductSpecsResponse,
     GoogleShoppingResponse,
 )
+from app.scraper.searchapi.client import get_sync_client
 
 
 def search_google_shopping(
@@ -47,8 +49,6 @@ def search_google_shopping(
     if not api_key:
         raise ValueError("SEARCHAPI_API_KEY not found in settings")
 
-    url = "https://www.searchapi.io/api/v1/search"
-
     params: dict[str, str | int | float] = {
         "engine": "google_shopping",
         "q": query,
@@ -69,9 +69,9 @@ def search_google_shopping(
         params["condition"] = condition
 
     try:
-        response = httpx.get(url, params=params)
+        response = get_sync_client().get("/api/v1/search", params=params)
         response.raise_for_status()
-        return GoogleShoppingResponse(**response.json())
+        return GoogleShoppingResponse.model_validate(from_json(response.content))
     except httpx.RequestError as e:
         raise Exception(f"Error searching Google Shopping: {str(e)}") from e
 
@@ -107,8 +107,6 @@ def get_google_product(product_id: str, location: str = "United States", gl: str
     if not api_key:
         raise ValueError("SEARCHAPI_API_KEY not found in settings")
 
-    url = "https://www.searchapi.io/api/v1/search"
-
     params: dict[str, str | int | float] = {
         "engine": "google_product",
         "product_id": product_id,
@@ -119,9 +117,9 @@ def get_google_product(product_id: str, location: str = "United States", gl: str
     }
 
     try:
-        response = httpx.get(url, params=params)
+        response = get_sync_client().get("/api/v1/search", params=params)
         response.raise_for_status()
-        return GoogleProductResponse(**response.json())
+        return GoogleProductResponse.model_validate(from_json(response.content))
     except httpx.RequestError as e:
         raise Exception(f"Error fetching product details: {str(e)}") from e
 
@@ -153,8 +151,6 @@ def get_product_specifications(
     if not api_key:
         raise ValueError("SEARCHAPI_API_KEY not found in settings")
 
-    url = "https://www.searchapi.io/api/v1/search"
-
     params: dict[str, str | int | float] = {
         "engine": "google_product_specs",
         "product_id": product_id,
@@ -168,9 +164,9 @@ def get_product_specifications(
         params["prds"] = prds
 
     try:
-        response = httpx.get(url, params=params)
+        response = get_sync_client().get("/api/v1/search", params=params)
         response.raise_for_status()
-        return GoogleProductSpecsResponse(**response.json())
+        return GoogleProductSpecsResponse.model_validate(from_json(response.content))
     except httpx.RequestError as e:
         raise Exception(f"Error fetching product specifications: {str(e)}") from e
 
@@ -210,8 +206,6 @@ def get_product_offers(
     if not api_key:
         raise ValueError("SEARCHAPI_API_KEY not found in settings")
 
-    url = "https://www.searchapi.io/api/v1/search"
-
     params: dict[str, str | int | float] = {
         "engine": "google_product_offers",
         "product_id": product_id,
@@ -232,9 +226,9 @@ def get_product_offers(
         params["prds"] = prds
 
     try:
-        response = httpx.get(url, params=params)
+        response = get_sync_client().get("/api/v1/search", params=params)
         response.raise_for_status()
-        return GoogleProductOffersResponse(**response.json())
+        return GoogleProductOffersResponse.model_validate(from_json(response.content))
     except httpx.RequestError as e:
         raise Exception(f"Error fetching product offers: {str(e)}") from e
 
@@ -268,8 +262,6 @@ def get_product_reviews(
     if not api_key:
         raise ValueError("SEARCHAPI_API_KEY not found in settings")
 
-    url = "https://www.searchapi.io/api/v1/search"
-
     params: dict[str, str | int | float] = {
         "engine": "google_product_reviews",
         "product_id": product_id,
@@ -286,9 +278,9 @@ def get_product_reviews(
         params["next_page_token"] = next_page_token
 
     try:
-        response = httpx.get(url, params=params)
+        response = get_sync_client().get("/api/v1/search", params=params)
         response.raise_for_status()
-        return GoogleProductReviewsResponse(**response.json())
+        return GoogleProductReviewsResponse.model_validate(from_json(response.content))
     except httpx.RequestError as e:
         raise Exception(f"Error fetching product reviews: {str(e)}") from e
 
@@ -5,8 +5,11 @@ from pathlib import Path
 
 import httpx
 from loguru import logger
+from pydantic_core import from_json, to_json
 
 from app.config import get_settings
+from app.scraper.oxylabs.client import get_client
+from app.scraper.utils import debug_file_name
 
 
 def save_debug_response(url: str, data: dict) -> None:
@@ -19,8 +22,7 @@ def save_debug_response(url: str, data: dict) -> None:
     debug_dir = Path("debug")
     debug_dir.mkdir(exist_ok=True)
 
-    # Create safe filename from URL
-    safe_name = "".join(c if c.isalnum() else "_" for c in url.split("//")[-1])[:100]
+    safe_name = debug_file_name(url)
     json_path = debug_dir / f"{safe_name}_response.json"
 
     with open(json_path, "w") as f:
@@ -49,15 +51,14 @@ async def fetch_universal_raw(target_url: str) -> dict:
     if not username or not password:
         raise ValueError("Oxylabs credentials required. Set OXYLABS_USERNAME and OXYLABS_PASSWORD env vars.")
 
-    api_url = "https://realtime.oxylabs.io/v1/queries"
     payload = {"source": "universal", "url": target_url, "parse": False}  # Get raw HTML
 
     logger.info(f"Fetching {target_url} via Oxylabs universal scraper")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(api_url, json=payload, auth=(username, password), timeout=30.0)
-            response.raise_for_status()
-            return response.json()
+        response = await get_client().post("/v1/queries", content=to_json(payload), auth=(username, password))
+        response.raise_for_status()
+        # Parse in Rust: the response embeds the whole page, often several MB
+        return from_json(response.content)
     except httpx.HTTPError as e:
         logger.error(f"HTTP error fetching {target_url}: {str(e)}")
         raise
@@ -79,8 +80,8 @@ async def fetch_universal(target_url: str) -> str:
     try:
         data = await fetch_universal_raw(target_url)
 
-        # Debug the actual structure
-        logger.debug(f"Response structure: {json.dumps(data, indent=2)[:500]}...")
+        # Debug the actual structure, without serializing the whole page-sized response just to log its start
+        logger.debug(f"Response keys: {list(data)}")
 
         # Extract HTML content from response
         if "results" not in data or not data["results"]:
@@ -90,7 +91,7 @@ async def fetch_universal(target_url: str) -> str:
         result = data["results"][0]
 
         # Debug the result structure
-        logger.debug(f"Result structure: {json.dumps(result, indent=2)[:500]}...")
+        logger.debug(f"Result keys: {list(result)}")
 
         # Check if content is a string or dict
         if "content" not in result:
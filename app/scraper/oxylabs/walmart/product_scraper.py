@@ -3,8 +3,10 @@ import json
 import httpx
 from loguru import logger
 from pydantic import ValidationError
+from pydantic_core import from_json, to_json
 
 from app.config import get_settings
+from app.scraper.oxylabs.client import get_client
 from app.scraper.oxylabs.walmart.models import (
     OxyWalmartResponse,
     parse_walmart_response,
@@ -32,7 +34,6 @@ async def fetch_walmart_product(product_url: str) -> OxyWalmartResponse:
     if not username or not password:
         raise ValueError("Oxylabs credentials required. Set OXYLABS_USERNAME and " "OXYLABS_PASSWORD env vars or pass directly.")
 
-    api_url = "https://realtime.oxylabs.io/v1/queries"
     payload = {
         "source": "universal",
         "url": product_url,
@@ -41,22 +42,21 @@ async def fetch_walmart_product(product_url: str) -> OxyWalmartResponse:
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(api_url, json=payload, auth=(username, password), timeout=30.0)
-            response.raise_for_status()
-
-            data = response.json()
-            logger.info(f"Successfully fetched data for URL: {product_url}")
-
-            # Log raw response for debugging
-            logger.info(f"Raw response: {json.dumps(data, indent=2)}")
-
-            # Parse response into OxyWalmartResponse model
-            try:
-                return parse_walmart_response(data)
-            except ValidationError as e:
-                logger.error(f"Validation error parsing response: {e.errors()}")
-                raise
+        response = await get_client().post("/v1/queries", content=to_json(payload), auth=(username, password))
+        response.raise_for_status()
+
+        data = from_json(response.content)
+        logger.info(f"Successfully fetched data for URL: {product_url}")
+
+        # Log raw response for debugging
+        logger.info(f"Raw response: {json.dumps(data, indent=2)}")
+
+        # Parse response into OxyWalmartResponse model
+        try:
+            return parse_walmart_response(data)
+        except ValidationError as e:
+            logger.error(f"Validation error parsing response: {e.errors()}")
+            raise
 
     except httpx.HTTPError as e:
         logger.error(f"HTTP error fetching URL {product_url}: {str(e)}")
@@ -0,0 +1,50 @@
+"""Shared HTTP clients for the SearchAPI.io API"""
+
+import httpx
+
+SEARCHAPI_URL = "https://www.searchapi.io"
+
+_client: httpx.AsyncClient | None = None
+_sync_client: httpx.Client | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared SearchAPI client, creating it on first use
+
+    Returns:
+        httpx.AsyncClient with a pooled HTTP/2 connection to SearchAPI
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=SEARCHAPI_URL,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(30.0),
+        )
+    return _client
+
+
+def get_sync_client() -> httpx.Client:
+    """
+    Get the shared blocking SearchAPI client, creating it on first use
+
+    Returns:
+        httpx.Client with a pooled HTTP/2 connection to SearchAPI
+    """
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed:
+        _sync_client = httpx.Client(base_url=SEARCHAPI_URL, http2=True, timeout=httpx.Timeout(30.0))
+    return _sync_client
+
+
+async def close_client() -> None:
+    """Close the shared SearchAPI clients"""
+    global _client, _sync_client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
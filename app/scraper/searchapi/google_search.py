@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field, model_validator
 
 from app.config import get_settings
 from app.scraper.crawler.html_fetcher import OutputFormat, fetch_batch
+from app.scraper.searchapi.client import get_client
 from app.utils.count_token import count_model_tokens, count_tokens
 
 
@@ -861,8 +862,6 @@ async def search_google(
         httpx.HTTPError: If the API request fails
         ValueError: If API key is not found
     """
-    url = "https://www.searchapi.io/api/v1/search"
-
     settings = get_settings()
     api_key = settings.SEARCHAPI_API_KEY
     if not api_key:
@@ -880,9 +879,8 @@ async def search_google(
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=30)
-            response.raise_for_status()
+        response = await get_client().get("/api/v1/search", params=params)
+        response.raise_for_status()
 
         response_json = response.json()
         search_response = GoogleSearchResponse.model_validate(response_json)
@@ -6,6 +6,7 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from app.config import get_settings
+from app.scraper.searchapi.client import get_client
 
 
 class SearchMetadata(BaseModel):
@@ -120,20 +121,17 @@ async def search_products(
     if not api_key:
         raise ValueError("SEARCHAPI_API_KEY not found in settings")
 
-    url = "https://www.searchapi.io/api/v1/search"
-
     params = {"engine": "google_shopping", "q": query, "gl": country, "hl": language, "location": location, "api_key": api_key}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+    try:
+        response = await get_client().get("/api/v1/search", params=params)
+        response.raise_for_status()
 
-            return GoogleShoppingResponse.model_validate(response.json())  # type: ignore
+        return GoogleShoppingResponse.model_validate(response.json())  # type: ignore
 
-        except httpx.HTTPError as e:
-            logger.error(f"API request failed: {str(e)}")
-            raise
+    except httpx.HTTPError as e:
+        logger.error(f"API request failed: {str(e)}")
+        raise
 
 
 class ReviewHistogram(BaseModel):
@@ -310,8 +308,6 @@ async def get_product_details(product_id: str, prds: str | None = None, language
         httpx.HTTPError: If the API request fails
         ValueError: If API key is not found
     """
-    url = "https://www.searchapi.io/api/v1/search"
-
     settings = get_settings()
     api_key = settings.SEARCHAPI_API_KEY
     if not api_key:
@@ -322,16 +318,15 @@ async def get_product_details(product_id: str, prds: str | None = None, language
     if prds:
         params["prds"] = prds
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+    try:
+        response = await get_client().get("/api/v1/search", params=params)
+        response.raise_for_status()
 
-            return GoogleProductResponse.model_validate(response.json())  # type: ignore
+        return GoogleProductResponse.model_validate(response.json())  # type: ignore
 
-        except httpx.HTTPError as e:
-            logger.error(f"API request failed: {str(e)}")
-            raise
+    except httpx.HTTPError as e:
+        logger.error(f"API request failed: {str(e)}")
+        raise
 
 
 async def search_product_details(
@@ -1,6 +1,23 @@
 import re
 from urllib.parse import unquote, urlparse, urlunparse
 
+AMAZON_HOST_RE = re.compile(r"^(?:www\.)?amazon\.(?:com|co\.uk|ca|de|fr|co\.jp|in|it|es|nl)$")
+AMAZON_PRODUCT_PATH_RE = re.compile(
+    r"/dp/[A-Za-z0-9]{10}"  # Standard product URL
+    r"|/gp/product/[A-Za-z0-9]{10}"  # Alternative product URL
+    r"|/gp/aw/d/[A-Za-z0-9]{10}"  # Mobile URLs
+    r"|/[^/]+/dp/[A-Za-z0-9]{10}",  # Category URLs
+    re.IGNORECASE,
+)
+AMAZON_ASIN_RE = re.compile(r"/(?:dp|gp/product|[^/]+)/([A-Z0-9]{10})(?:/|\?|$)")
+
+WALMART_HOST_RE = re.compile(r"^(?:www\.)?walmart\.com$")
+WALMART_PRODUCT_ID_RE = re.compile(r"/ip/(?:[^/]+/)?(\d+)(?:/|\?|$)")
+WALMART_SLUG_RE = re.compile(r"/ip/([^/]+)/\d+(?:/|\?|$)")
+
+# Characters replaced in debug file names: anything but Unicode letters and digits (underscores map to themselves)
+UNSAFE_FILENAME_CHAR_RE = re.compile(r"\W")
+
 
 def is_amazon_url(url: str) -> bool:
     """
@@ -17,19 +34,12 @@ def is_amazon_url(url: str) -> bool:
         parsed = urlparse(url)
 
         # Check domain is amazon
-        if not re.match(r"^(?:www\.)?amazon\.(?:com|co\.uk|ca|de|fr|co\.jp|in|it|es|nl)$", parsed.netloc.lower()):
+        if not AMAZON_HOST_RE.match(parsed.netloc.lower()):
             return False
 
         # Check path patterns for product pages
         path = parsed.path.rstrip("/")
-        valid_patterns = [
-            r"/dp/[A-Za-z0-9]{10}",  # Standard product URL
-            r"/gp/product/[A-Za-z0-9]{10}",  # Alternative product URL
-            r"/gp/aw/d/[A-Za-z0-9]{10}",  # Mobile URLs
-            r"/[^/]+/dp/[A-Za-z0-9]{10}",  # Category URLs
-        ]
-
-        return any(re.search(pattern, path, re.IGNORECASE) for pattern in valid_patterns)
+        return bool(AMAZON_PRODUCT_PATH_RE.search(path))
 
     except Exception:
         return False
@@ -48,10 +58,10 @@ def is_walmart_url(url: str) -> bool:
     try:
         parsed = urlparse(url)
         # Check domain
-        if not re.match(r"^(?:www\.)?walmart\.com$", parsed.netloc):
+        if not WALMART_HOST_RE.match(parsed.netloc):
             return False
         # Check path pattern for product URLs
-        return bool(re.search(r"/ip/(?:[^/]+/)?(?:\d+)(?:/|\?|$)", parsed.path))
+        return bool(WALMART_PRODUCT_ID_RE.search(parsed.path))
     except Exception:
         return False
 
@@ -77,7 +87,7 @@ def extract_asin_and_slug(url: str) -> tuple[str, str | None]:
     # /dp/ASIN
     # /gp/product/ASIN
     # /*/ASIN/
-    asin_match = re.search(r"/(?:dp|gp/product|[^/]+)/([A-Z0-9]{10})(?:/|\?|$)", path)
+    asin_match = AMAZON_ASIN_RE.search(path)
     if not asin_match:
         raise ValueError("Could not extract ASIN from URL")
 
@@ -113,12 +123,12 @@ def extract_walmart_id_and_slug(url: str) -> tuple[str, str | None]:
     # Extract product ID from URL patterns like:
     # /ip/SLUG/PRODUCT_ID
     # /ip/PRODUCT_ID
-    product_id_match = re.search(r"/ip/(?:[^/]+/)?(\d+)(?:/|\?|$)", url)
+    product_id_match = WALMART_PRODUCT_ID_RE.search(url)
     if not product_id_match:
         raise ValueError("Could not extract product ID from Walmart URL")
 
     # Try to extract product name/slug from URL
-    slug_match = re.search(r"/ip/([^/]+)/\d+(?:/|\?|$)", url)
+    slug_match = WALMART_SLUG_RE.search(url)
     slug = slug_match.group(1) if slug_match else None
 
     return product_id_match.group(1), slug
@@ -143,3 +153,16 @@ def normalize_url(url: str) -> str:
 
     # Remove trailing slash if present
     return clean_url.rstrip("/")
+
+
+def debug_file_name(url: str) -> str:
+    """
+    Build a file name for debug output from a URL
+
+    Args:
+        url: Source URL
+
+    Returns:
+        Up to 100 characters of the URL after the scheme, with every non-alphanumeric character replaced by an underscore
+    """
+    return UNSAFE_FILENAME_CHAR_RE.sub("_", url.split("//")[-1][:100])
@@ -0,0 +1,77 @@
+"""Tests for LLM response cache"""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.llm.cache import LLMCache, MemoryBackend, cached_completion
+
+
+@pytest.fixture(autouse=True)
+def cache_settings() -> Any:
+    """Enable caching without requiring the full application settings"""
+    with patch("app.llm.cache.get_settings", return_value=SimpleNamespace(ENABLE_CACHE=True, CACHE_TTL=3600)):
+        yield
+
+
+def make_client(content: str) -> MagicMock:
+    """Create a fake OpenAI client returning the given content"""
+    client = MagicMock()
+    message = SimpleNamespace(content=content)
+    client.chat.completions.create = AsyncMock(return_value=SimpleNamespace(choices=[SimpleNamespace(message=message)]))
+    return client
+
+
+def test_make_key_is_stable() -> None:
+    """Test cache keys depend only on the request payload"""
+    messages = [{"role": "user", "content": "hi"}]
+    assert LLMCache.make_key("m", messages) == LLMCache.make_key("m", list(messages))
+    assert LLMCache.make_key("m", messages) != LLMCache.make_key("other", messages)
+    assert LLMCache.make_key("m", messages, {"temperature": 0}) != LLMCache.make_key("m", messages, {"temperature": 0, "max_tokens": 10})
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used() -> None:
+    """Test LRU eviction and expiry in the memory backend"""
+    backend = MemoryBackend(max_entries=2)
+    await backend.set("a", "1", ttl=60)
+    await backend.set("b", "2", ttl=60)
+    await backend.get("a")
+    await backend.set("c", "3", ttl=60)
+
+    assert await backend.get("a") == "1"
+    assert await backend.get("b") is None
+
+    await backend.set("d", "4", ttl=-1)
+    assert await backend.get("d") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_completion_reuses_response() -> None:
+    """Test identical opted-in requests hit the cache"""
+    cache = LLMCache()
+    client = make_client("summary")
+    messages = [{"role": "user", "content": "summarize"}]
+
+    assert await cached_completion(client, "m", messages, cache=cache, use_cache=True) == "summary"
+    assert await cached_completion(client, "m", messages, cache=cache, use_cache=True) == "summary"
+
+    client.chat.completions.create.assert_awaited_once()
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_cached_completion_skips_cache_unless_opted_in() -> None:
+    """Test requests that don't opt in, or that sample above temperature 0, bypass the cache"""
+    cache = LLMCache()
+    client = make_client("summary")
+    messages = [{"role": "user", "content": "summarize"}]
+
+    await cached_completion(client, "m", messages, cache=cache)
+    await cached_completion(client, "m", messages, cache=cache)
+    await cached_completion(client, "m", messages, cache=cache, use_cache=True, temperature=0.7)
+    await cached_completion(client, "m", messages, cache=cache, use_cache=True, temperature=0.7)
+
+    assert client.chat.completions.create.await_count == 4
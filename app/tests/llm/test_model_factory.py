@@ -0,0 +1,48 @@
+"""Tests for shared LLM clients"""
+
+import asyncio
+import threading
+
+import pytest
+from openai import AsyncOpenAI
+
+from app.llm.model_factory import close_clients, get_client
+
+BASE_URL = "https://llm.example.com/v1"
+
+
+def test_get_client_is_shared_per_event_loop() -> None:
+    """Test a client is reused within a loop and a new loop gets its own client"""
+
+    async def get_twice() -> tuple[AsyncOpenAI, AsyncOpenAI]:
+        return get_client(BASE_URL, "key"), get_client(BASE_URL, "key")
+
+    first, again = asyncio.run(get_twice())
+    second, _ = asyncio.run(get_twice())
+
+    assert first is again
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_close_clients_closes_clients_of_every_running_loop() -> None:
+    """Test close_clients reaches clients created on another thread's loop as well as the current one"""
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def get() -> AsyncOpenAI:
+        return get_client(BASE_URL, "key")
+
+    try:
+        other_client = asyncio.run_coroutine_threadsafe(get(), other_loop).result()
+        client = get_client(BASE_URL, "key")
+
+        await close_clients()
+
+        assert client.is_closed()
+        assert other_client.is_closed()
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
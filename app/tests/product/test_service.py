@@ -0,0 +1,45 @@
+# type: ignore
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from product.service import get_product, get_products, is_amazon_url
+
+from app.scraper.bright_data.amazon import Product as AmazonProduct
+from app.scraper.bright_data.amazon import ProductResponse
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://www.amazon.com/dp/B089M1BH1K", True),
+        ("https://smile.amazon.co.uk/dp/B089M1BH1K", True),
+        ("amazon.com/dp/B089M1BH1K", True),
+        ("www.amazon.com/dp/B089M1BH1K", True),
+        ("smile.amazon.co.uk/dp/B089M1BH1K", True),
+        ("amazon.com/gp//product/B089M1BH1K", True),
+        ("https://example.com/amazon.com/dp/B089M1BH1K", False),
+        ("example.com/?ref=www.amazon.com", False),
+    ],
+)
+def test_is_amazon_url(url: str, expected: bool) -> None:
+    """Test Amazon URLs are recognised by host, with or without a scheme"""
+    assert is_amazon_url(url) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_products_aligns_results_with_urls() -> None:
+    """Test products come back in request order, with None for URLs the scraper returned nothing for"""
+    urls = ["https://www.amazon.com/dp/A", "https://www.amazon.com/dp/B", "https://www.amazon.com/dp/C"]
+    response = ProductResponse(
+        products=[
+            AmazonProduct(title="C", url="https://www.amazon.com/dp/C?th=1", input={"url": urls[2]}),
+            AmazonProduct(title="A", url=urls[0]),
+        ]
+    )
+
+    with (
+        patch("product.service.scrape_amazon_product", AsyncMock(return_value=response)),
+        patch("product.service.parse_amazon_product", side_effect=lambda amazon_product: amazon_product.title),
+    ):
+        assert await get_products(urls) == ["A", None, "C"]
+        assert await get_product(urls[1]) is None
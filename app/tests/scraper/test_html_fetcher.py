@@ -0,0 +1,128 @@
+"""Tests for HTML fetcher helpers"""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.scraper.crawler.html_fetcher import (
+    ENCODING_SNIFF_BYTES,
+    OutputFormat,
+    autodetect,
+    convert_reddit_url_to_json,
+    extract_youtube_id,
+    fetch_batch,
+    fetch_direct,
+    html_to_markdown,
+    sanitize_markdown_links,
+)
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42s", "dQw4w9WgXcQ"),
+        ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://youtu.be/dQw4w9WgXcQ?si=abc123", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?v=", None),
+        ("https://example.com/watch?v=dQw4w9WgXcQ", None),
+    ],
+)
+def test_extract_youtube_id(url: str, expected: str | None) -> None:
+    """Test video ID extraction from YouTube links"""
+    assert extract_youtube_id(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        (
+            "https://www.reddit.com/r/keurig/comments/ytv37m/ksupreme_vs_kelite/",
+            "https://www.reddit.com/r/keurig/comments/ytv37m/ksupreme_vs_kelite.json",
+        ),
+        (
+            "https://www.reddit.com/r/keurig/comments/ytv37m/ksupreme_vs_kelite.json",
+            "https://www.reddit.com/r/keurig/comments/ytv37m/ksupreme_vs_kelite.json",
+        ),
+        (
+            "https://www.reddit.com/r/keurig/comments/ytv37m/ksupreme_vs_kelite/?utm_source=share&utm_medium=web",
+            "https://www.reddit.com/r/keurig/comments/ytv37m/ksupreme_vs_kelite.json?utm_source=share&utm_medium=web",
+        ),
+        (
+            "https://www.reddit.com/r/keurig/comments/ytv37m/ksupreme_vs_kelite/#comments",
+            "https://www.reddit.com/r/keurig/comments/ytv37m/ksupreme_vs_kelite.json",
+        ),
+    ],
+)
+def test_convert_reddit_url_to_json(url: str, expected: str) -> None:
+    """Test Reddit links map to their JSON API URL, keeping any query string valid"""
+    assert convert_reddit_url_to_json(url) == expected
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        ("<p>Prix : 12 € — très bon</p>".encode(), "utf-8"),
+        # A multi-byte character cut off at the end of the sampled bytes is still UTF-8
+        (("a" * (ENCODING_SNIFF_BYTES - 1) + "é").encode(), "utf-8"),
+        ("<p>Привет мир, это тест кодировки страницы</p>".encode("cp1251") * 10, "windows-1251"),
+        (b"", "utf-8"),
+    ],
+)
+def test_autodetect(content: bytes, expected: str) -> None:
+    """Test UTF-8 bodies short-circuit detection and other encodings are still detected"""
+    assert autodetect(content) == expected
+
+
+@pytest.mark.parametrize(
+    "markdown,expected",
+    [
+        ("Read [the review](https://example.com/review) first", "Read the review first"),
+        ("Source: https://example.com/a?b=1 and more", "Source:  and more"),
+        ("[https://example.com](https://example.com) link", " link"),
+        ("No links here", "No links here"),
+    ],
+)
+def test_sanitize_markdown_links(markdown: str, expected: str) -> None:
+    """Test links are reduced to their text and bare URLs are removed"""
+    assert sanitize_markdown_links(markdown) == expected
+
+
+def test_html_to_markdown() -> None:
+    """Test main content is converted while navigation, scripts and comments are dropped"""
+    html = (
+        "<html><body><nav><a href='/'>Home</a></nav><main>"
+        "<h2>Battery life</h2><!-- hidden note --><p>Lasts <b>two days</b></p>"
+        "<ul><li>Fast charging</li></ul><a href='https://example.com/review'>Full review</a>"
+        "<script>var tracking = 1;</script></main></body></html>"
+    )
+    assert html_to_markdown(html) == "  ## Battery life\n  Lasts\n    **two days**\n    * Fast charging\n  [Full review](https://example.com/review)"
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_fetches_repeated_urls_once() -> None:
+    """Test URLs differing only by fragment or trailing slash share one fetch"""
+    mock_fetch = AsyncMock(side_effect=lambda url, *args: f"<p>{url}</p>")
+    urls = ["https://example.com/item", "https://example.com/item/#reviews", "https://example.com/other"]
+
+    with patch("app.scraper.crawler.html_fetcher.fetch", mock_fetch):
+        results = await fetch_batch(urls, output_format=OutputFormat.HTML, save_debug=False)
+
+    assert mock_fetch.await_count == 2
+    assert results == {
+        "https://example.com/item": "<p>https://example.com/item</p>",
+        "https://example.com/item/#reviews": "<p>https://example.com/item</p>",
+        "https://example.com/other": "<p>https://example.com/other</p>",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code,expected_content", [(200, "<p>ok</p>"), (404, None)])
+async def test_fetch_direct_returns_status_code(status_code: int, expected_content: str | None) -> None:
+    """Test the status code of the single request is returned with the content"""
+    transport = httpx.MockTransport(lambda request: httpx.Response(status_code, text="<p>ok</p>"))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch("app.scraper.crawler.html_fetcher.get_client", return_value=client):
+            assert await fetch_direct("https://example.com/item") == (expected_content, status_code)
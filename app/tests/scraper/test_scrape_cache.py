@@ -0,0 +1,66 @@
+"""Tests for the scrape cache"""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.scraper.cache import ScrapeCache
+
+
+@pytest.fixture
+def cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ScrapeCache:
+    """Create a cache in a temporary directory without requiring the full application settings"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("app.scraper.cache.get_settings", lambda: SimpleNamespace(ENABLE_CACHE=True, CACHE_TTL=3600))
+    return ScrapeCache("test_cache.sqlite")
+
+
+def test_set_and_get(cache: ScrapeCache) -> None:
+    """Test stored data is returned for its URL only"""
+    cache.set("https://example.com", {"title": "Example"})
+    assert cache.get("https://example.com") == {"title": "Example"}
+    assert cache.get("https://missing.example.com") is None
+
+
+def test_entries_persist_across_instances(cache: ScrapeCache) -> None:
+    """Test entries are readable from a new cache on the same file"""
+    cache.set("https://example.com", {"title": "Example"})
+    assert ScrapeCache("test_cache.sqlite").get("https://example.com") == {"title": "Example"}
+
+
+def test_expired_entry_is_dropped(cache: ScrapeCache) -> None:
+    """Test expired entries are not returned and are removed"""
+    cache.set("https://example.com", {"title": "Example"})
+    with patch("app.scraper.cache.time.time", return_value=10**12):
+        assert cache.get("https://example.com") is None
+    assert cache.get("https://example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_writes_are_batched_until_flush(cache: ScrapeCache) -> None:
+    """Test writes made inside an event loop are readable immediately and persisted on flush"""
+    cache.set("https://a.example.com", {"title": "A"})
+    cache.set("https://b.example.com", {"title": "B"})
+    assert cache.get("https://a.example.com") == {"title": "A"}
+    assert ScrapeCache("test_cache.sqlite").get("https://a.example.com") is None
+
+    await cache.flush()
+    reopened = ScrapeCache("test_cache.sqlite")
+    assert reopened.get("https://a.example.com") == {"title": "A"}
+    assert reopened.get("https://b.example.com") == {"title": "B"}
+
+
+def test_failed_write_stays_pending(cache: ScrapeCache) -> None:
+    """Test entries from a failed flush are kept and written by the next one"""
+    cache.conn.execute("CREATE TRIGGER fail_insert BEFORE INSERT ON cache BEGIN SELECT RAISE(ABORT, 'disk full'); END")
+    cache.set("https://a.example.com", {"title": "A"})
+    assert not cache.conn.in_transaction
+    assert cache.get("https://a.example.com") == {"title": "A"}
+
+    cache.conn.execute("DROP TRIGGER fail_insert")
+    cache.set("https://b.example.com", {"title": "B"})
+    reopened = ScrapeCache("test_cache.sqlite")
+    assert reopened.get("https://a.example.com") == {"title": "A"}
+    assert reopened.get("https://b.example.com") == {"title": "B"}
@@ -3,6 +3,7 @@
 import pytest
 
 from app.scraper.utils import (
+    debug_file_name,
     extract_asin_and_slug,
     extract_walmart_id_and_slug,
     is_amazon_url,
@@ -149,3 +150,16 @@ def test_normalize_url(input_url: str, expected: str) -> None:
         expected: Expected normalized output
     """
     assert normalize_url(input_url) == expected
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://www.example.com/a-b?c=d", "www_example_com_a_b_c_d"),
+        ("https://example.com/café_ü", "example_com_café_ü"),
+        ("https://example.com/" + "x" * 200, "example_com_" + "x" * 88),
+    ],
+)
+def test_debug_file_name(url: str, expected: str) -> None:
+    """Test building debug file names from URLs"""
+    assert debug_file_name(url) == expected
@@ -1,9 +1,53 @@
 #!/usr/bin/env python3
 
 import asyncio
+import atexit
 import tempfile
+import weakref
+from dataclasses import dataclass, field
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Playwright, async_playwright
+
+
+@dataclass
+class _BrowserState:
+    """Playwright browser shared by the screenshots taken on one event loop"""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    playwright: Playwright | None = None
+    browser: Browser | None = None
+
+
+# Browsers keyed by the event loop they were launched on, since a Playwright connection can't move between loops
+_browsers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _BrowserState] = weakref.WeakKeyDictionary()
+# Event loop owned by take_screenshot_sync, kept open so the browser bound to it is reused across calls
+_sync_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def get_browser() -> Browser:
+    """
+    Get the headless Chromium browser of the running event loop, launching it on first use
+
+    Returns:
+        Browser reused across screenshots on this event loop
+    """
+    state = _browsers.setdefault(asyncio.get_running_loop(), _BrowserState())
+    async with state.lock:
+        if state.browser is None or not state.browser.is_connected():
+            state.playwright = state.playwright or await async_playwright().start()
+            state.browser = await state.playwright.chromium.launch(headless=True)
+    return state.browser
+
+
+async def close_browser() -> None:
+    """Close the running event loop's browser and stop its Playwright"""
+    state = _browsers.pop(asyncio.get_running_loop(), None)
+    if state is None:
+        return
+    if state.browser is not None:
+        await state.browser.close()
+    if state.playwright is not None:
+        await state.playwright.stop()
 
 
 async def take_screenshot(url: str, output_path: str = None, width: int = 1280, height: int = 720) -> str:
@@ -25,15 +69,15 @@ async def take_screenshot(url: str, output_path: str = None, width: int = 1280,
         output_path = temp_file.name
         temp_file.close()
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page(viewport={"width": width, "height": height})
+    browser = await get_browser()
+    context = await browser.new_context(viewport={"width": width, "height": height})
 
-        try:
-            await page.goto(url, wait_until="networkidle")
-            await page.screenshot(path=output_path, full_page=True)
-        finally:
-            await browser.close()
+    try:
+        page = await context.new_page()
+        await page.goto(url, wait_until="networkidle")
+        await page.screenshot(path=output_path, full_page=True)
+    finally:
+        await context.close()
 
     return output_path
 
@@ -41,8 +85,24 @@ async def take_screenshot(url: str, output_path: str = None, width: int = 1280,
 def take_screenshot_sync(url: str, output_path: str = None, width: int = 1280, height: int = 720) -> str:
     """
     Synchronous wrapper for take_screenshot.
+
+    Runs on a long-lived event loop so consecutive calls share one browser;
+    close_browser_sync() shuts it down and also runs at interpreter exit.
     """
-    return asyncio.run(take_screenshot(url, output_path, width, height))
+    global _sync_loop
+    if _sync_loop is None:
+        _sync_loop = asyncio.new_event_loop()
+        atexit.register(close_browser_sync)
+    return _sync_loop.run_until_complete(take_screenshot(url, output_path, width, height))
+
+
+def close_browser_sync() -> None:
+    """Close the browser and the event loop used by take_screenshot_sync"""
+    global _sync_loop
+    if _sync_loop is not None:
+        _sync_loop.run_until_complete(close_browser())
+        _sync_loop.close()
+        _sync_loop = None
 
 
 if __name__ == "__main__":